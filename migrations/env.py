@@ -4,9 +4,8 @@ import os
 from logging.config import fileConfig
 
 from alembic import context
-from sqlalchemy import engine_from_config, pool
 
-from shared_lib.db import get_database_uri
+from shared_lib.db import get_database_uri, get_engine
 from vote_api.models.database import Base
 
 config = context.config
@@ -38,21 +37,15 @@ def run_migrations_offline() -> None:
 
 def run_migrations_online() -> None:
     """Run migrations in 'online' mode."""
-    configuration = config.get_section(config.config_ini_section) or {}
-    configuration["sqlalchemy.url"] = get_url()
-
-    connectable = engine_from_config(
-        configuration,
-        prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
-    )
+    connectable = get_engine(async_driver=False)
 
     with connectable.connect() as connection:
-        connection.execution_options(
-            isolation_level="AUTOCOMMIT"
-        ).exec_driver_sql("CREATE SCHEMA IF NOT EXISTS voting")
+        # The version table lives in the schema, so it must exist (and be
+        # committed) before Alembic opens its own transaction on this
+        # connection.
+        connection.exec_driver_sql("CREATE SCHEMA IF NOT EXISTS voting")
+        connection.commit()
 
-    with connectable.connect() as connection:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
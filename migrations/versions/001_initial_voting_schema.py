@@ -167,17 +167,24 @@ def upgrade() -> None:
         schema="voting",
     )
 
-    # Indexes for performance
-    op.create_index(
-        "idx_votes_category", "votes", ["category_id"], schema="voting"
-    )
-    op.create_index(
-        "idx_votes_fingerprint", "votes", ["fingerprint_hash"], schema="voting"
-    )
-    op.create_index(
-        "idx_elo_category", "elo_ratings", ["category_id"], schema="voting"
-    )
-    op.create_index("idx_items_group", "items", ["group_id"], schema="voting")
+    # Secondary indexes are built outside the table-creation transaction so
+    # they don't hold write locks on a populated database, and are skipped on
+    # retry if a previous run already produced them.
+    with op.get_context().autocommit_block():
+        for name, table, columns in (
+            ("idx_votes_category", "votes", ["category_id"]),
+            ("idx_votes_fingerprint", "votes", ["fingerprint_hash"]),
+            ("idx_elo_category", "elo_ratings", ["category_id"]),
+            ("idx_items_group", "items", ["group_id"]),
+        ):
+            op.create_index(
+                name,
+                table,
+                columns,
+                schema="voting",
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
 
 
 def downgrade() -> None:
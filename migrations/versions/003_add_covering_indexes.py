@@ -0,0 +1,55 @@
+"""Add composite/covering indexes for vote tallying and ELO reads.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, INCLUDE columns)
+_INDEXES = (
+    ("idx_votes_category_created", "votes", ["category_id", "created_at"], None),
+    ("idx_vote_choices_vote", "vote_choices", ["vote_id"], ["item_id", "rank"]),
+    (
+        "idx_elo_category_rating",
+        "elo_ratings",
+        ["category_id", "rating"],
+        ["item_id", "games_played"],
+    ),
+)
+
+
+def upgrade() -> None:
+    # Built concurrently so existing vote traffic isn't blocked.
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                schema="voting",
+                postgresql_include=include or [],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                schema="voting",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,50 @@
+"""Widen vote and vote choice ids to BIGINT.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column) pairs holding vote / vote choice ids.
+_COLUMNS = (
+    ("votes", "id"),
+    ("vote_choices", "id"),
+    ("vote_choices", "vote_id"),
+    ("comments", "vote_id"),
+)
+_SEQUENCES = ("votes_id_seq", "vote_choices_id_seq")
+
+
+def _retype(from_type: sa.types.TypeEngine, to_type: sa.types.TypeEngine) -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=to_type,
+            existing_type=from_type,
+            existing_nullable=False,
+            schema="voting",
+        )
+
+
+def upgrade() -> None:
+    _retype(sa.Integer(), sa.BigInteger())
+    for seq in _SEQUENCES:
+        op.execute(f"ALTER SEQUENCE voting.{seq} AS bigint")
+
+
+def downgrade() -> None:
+    for seq in _SEQUENCES:
+        op.execute(f"ALTER SEQUENCE voting.{seq} AS integer")
+    _retype(sa.BigInteger(), sa.Integer())
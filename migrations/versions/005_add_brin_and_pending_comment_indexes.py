@@ -0,0 +1,58 @@
+"""Add BRIN index on vote timestamps and a partial index for pending comments.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        # Votes are append-only, so created_at follows physical order and a
+        # BRIN index covers recency windows at a fraction of a B-tree's size.
+        op.create_index(
+            "idx_votes_created_brin",
+            "votes",
+            ["created_at"],
+            schema="voting",
+            postgresql_using="brin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        # The moderation queue only ever reads unapproved comments, newest
+        # first.
+        op.create_index(
+            "idx_comments_pending",
+            "comments",
+            [sa.text("created_at DESC")],
+            schema="voting",
+            postgresql_where=sa.text("is_approved = false"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table in (
+            ("idx_comments_pending", "comments"),
+            ("idx_votes_created_brin", "votes"),
+        ):
+            op.drop_index(
+                name,
+                table_name=table,
+                schema="voting",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
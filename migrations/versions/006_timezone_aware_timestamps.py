@@ -0,0 +1,54 @@
+"""Make timestamp columns timezone-aware.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Existing values were written as naive UTC (datetime.utcnow / NOW() on a
+# UTC server).
+_COLUMNS = (
+    ("categories", "created_at"),
+    ("votes", "created_at"),
+    ("comments", "created_at"),
+    ("elo_ratings", "updated_at"),
+)
+
+
+def upgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=False,
+            existing_server_default=sa.text("NOW()"),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            schema="voting",
+        )
+
+
+def downgrade() -> None:
+    for table, column in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            existing_server_default=sa.text("NOW()"),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            schema="voting",
+        )
@@ -0,0 +1,45 @@
+"""Store vote fingerprint/IP hashes as raw bytes.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = ("fingerprint_hash", "ip_hash")
+
+
+def upgrade() -> None:
+    for column in _COLUMNS:
+        op.alter_column(
+            "votes",
+            column,
+            type_=sa.LargeBinary(),
+            existing_type=sa.String(64),
+            existing_nullable=False,
+            postgresql_using=f"decode({column}, 'hex')",
+            schema="voting",
+        )
+
+
+def downgrade() -> None:
+    for column in _COLUMNS:
+        op.alter_column(
+            "votes",
+            column,
+            type_=sa.String(64),
+            existing_type=sa.LargeBinary(),
+            existing_nullable=False,
+            postgresql_using=f"encode({column}, 'hex')",
+            schema="voting",
+        )
@@ -0,0 +1,46 @@
+"""Add write-time vote tallies for results.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "vote_tallies",
+        sa.Column("category_id", sa.Integer(), nullable=False),
+        sa.Column("item_id", sa.Integer(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("vote_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["category_id"], ["voting.categories.id"]),
+        sa.ForeignKeyConstraint(["item_id"], ["voting.items.id"]),
+        sa.PrimaryKeyConstraint("category_id", "item_id", "rank"),
+        schema="voting",
+    )
+
+    # Backfill from existing choices; unranked choices land in rank 0
+    op.execute(
+        """
+        INSERT INTO voting.vote_tallies (category_id, item_id, rank, vote_count)
+        SELECT v.category_id, vc.item_id, COALESCE(vc.rank, 0), count(*)
+        FROM voting.vote_choices vc
+        JOIN voting.votes v ON v.id = vc.vote_id
+        GROUP BY v.category_id, vc.item_id, COALESCE(vc.rank, 0)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("vote_tallies", schema="voting")
@@ -0,0 +1,57 @@
+"""Cover the vote-status fingerprint probes with one index.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 00:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: Union[str, None] = "009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Replaces the single-column fingerprint index; leading with the hash
+    # serves both the single and bulk status lookups as index-only scans.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_votes_fingerprint_category",
+            "votes",
+            ["fingerprint_hash", "category_id"],
+            schema="voting",
+            postgresql_include=["id", "created_at"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_votes_fingerprint",
+            table_name="votes",
+            schema="voting",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_votes_fingerprint",
+            "votes",
+            ["fingerprint_hash"],
+            schema="voting",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "idx_votes_fingerprint_category",
+            table_name="votes",
+            schema="voting",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
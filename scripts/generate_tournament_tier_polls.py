@@ -11,43 +11,63 @@ Data sources:
   participants are selected from actual match participants
   (`player_appearance_teams`) by this score.
 
-Design goal: do batch DB reads and write many YAMLs in one run.
+Design goal: fetch everything in a single DB round trip (one combined query)
+and write many YAMLs in one run.
 """
 
 from __future__ import annotations
 
 import argparse
-import csv
+import asyncio
 import os
 import re
-import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Mapping, Sequence
+from typing import Any, Mapping
 
+import asyncpg
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # libyaml bindings not available
+    from yaml import SafeDumper as _YamlDumper
+
 _DEFAULT_SCHEMA = "comp_rankings"
+# Session settings for the one analytical query this script runs: skip JIT
+# compilation (pure overhead at this size), allow index prefetching, and give
+# the window-function sorts enough memory to stay off disk.
+_SERVER_SETTINGS = {
+    "jit": "off",
+    "effective_io_concurrency": "20",
+    "work_mem": "128MB",
+}
 _SCHEMA_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_SENDOU_ID_RE = re.compile(r"_sendou_(\d+)\.yaml$")
+# One `KEY=value` assignment per line; value may be single/double quoted.
+# `[ \t]` rather than `\s` keeps a match from spilling onto the next line.
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|([^\n]*?))[ \t]*\r?$""",
+    re.MULTILINE,
+)
 
 
 def load_env_file(path: Path) -> None:
-    """Minimal .env loader (no external deps)."""
+    """Minimal .env loader (no external deps).
+
+    Existing environment variables always win; the file only fills in keys
+    the environment doesn't set (e.g. RANKINGS_DB_SCHEMA inside Docker).
+    """
     if not path.exists():
         raise SystemExit(f"Env file not found: {path}")
 
-    for raw_line in path.read_text(encoding="utf-8").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if "=" not in line:
-            continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip("'").strip('"')
-        if key and key not in os.environ:
-            os.environ[key] = value
+    text = path.read_text(encoding="utf-8")
+    for m in _ENV_LINE_RE.finditer(text):
+        value = m.group(2) or m.group(3) or m.group(4) or ""
+        os.environ.setdefault(m.group(1), value)
 
 
 def resolve_schema() -> str:
@@ -96,11 +116,11 @@ def _collect_credentials(prefix: str) -> dict[str, str] | None:
     }
 
 
-def build_psql_conn_args() -> tuple[str, Mapping[str, str]]:
-    """Return (psql_conn_string, extra_env)."""
+def build_connect_kwargs() -> dict[str, Any]:
+    """Return keyword arguments for `asyncpg.connect` / `asyncpg.create_pool`."""
     url = os.getenv("DATABASE_URL")
     if url:
-        return url, {}
+        return {"dsn": url}
 
     creds = _collect_credentials("RANKINGS_DB_") or _collect_credentials("DB_")
     if not creds:
@@ -108,48 +128,16 @@ def build_psql_conn_args() -> tuple[str, Mapping[str, str]]:
             "Missing database configuration: set DATABASE_URL or RANKINGS_DB_* env vars"
         )
 
-    # Prefer passing password via env (avoid printing secrets).
-    env = {"PGPASSWORD": creds["password"]}
-    sslmode = f" sslmode={creds['sslmode']}" if creds.get("sslmode") else ""
-    conn = (
-        f"host={creds['host']} port={creds['port']} dbname={creds['name']} "
-        f"user={creds['user']}{sslmode}"
-    )
-    return conn, env
-
-
-def run_psql(
-    conn: str,
-    sql: str,
-    *,
-    extra_env: Mapping[str, str],
-) -> list[list[str]]:
-    cmd = [
-        "psql",
-        conn,
-        "-F",
-        "\t",
-        "-A",
-        "-t",
-        "-c",
-        sql,
-    ]
-    env = os.environ.copy()
-    env.update(extra_env)
-
-    proc = subprocess.run(
-        cmd,
-        check=False,
-        capture_output=True,
-        text=True,
-        env=env,
-    )
-    if proc.returncode != 0:
-        raise SystemExit(proc.stderr.strip() or f"psql failed: {proc.returncode}")
-
-    lines = [line for line in proc.stdout.splitlines() if line.strip()]
-    reader = csv.reader(lines, delimiter="\t")
-    return [list(row) for row in reader]
+    kwargs: dict[str, Any] = {
+        "host": creds["host"],
+        "port": int(creds["port"]),
+        "user": creds["user"],
+        "password": creds["password"],
+        "database": creds["name"],
+    }
+    if creds.get("sslmode"):
+        kwargs["ssl"] = creds["sslmode"]
+    return kwargs
 
 
 def safe_filename(prefix: str, tournament_id: int) -> str:
@@ -157,69 +145,64 @@ def safe_filename(prefix: str, tournament_id: int) -> str:
 
 
 def write_yaml(path: Path, data: Mapping[str, Any]) -> None:
-    path.write_text(
-        yaml.safe_dump(
+    with path.open("wb") as f:
+        yaml.dump(
             data,
+            f,
+            Dumper=_YamlDumper,
+            encoding="utf-8",
             sort_keys=False,
             allow_unicode=True,
-        ),
-        encoding="utf-8",
-    )
-
+        )
 
-def select_tournaments(
-    conn: str,
-    *,
-    extra_env: Mapping[str, str],
-    schema: str,
-    since_days: int,
-    size_limit: int,
-    prestige_limit: int,
-    max_series_events: int,
-    max_polls: int | None,
-) -> list[dict[str, Any]]:
-    since_ms = int((time.time() - since_days * 86400) * 1000)
-    poll_limit = int(max_polls) if max_polls and max_polls > 0 else 1_000_000
 
-    # Series heuristic: normalize recurring events down to a "series key".
-    #
-    # Goals:
-    # - Group different casings ("Fry Basket" vs "fry basket")
-    # - Group editions with "#<n>" suffixes
-    # - Group trailing numeric editions, including ones with parenthetical
-    #   descriptors (e.g. "... 30 (Grand Stage)")
-    # - Group LUTI-style division splits ("... - Division X")
-    # - Group co-host variants ("... + h20")
-    #
-    # Uses POSIX classes to avoid backslash escaping headaches in SQL.
-    series_key_sql = """
+def deactivate_poll_file(path: Path) -> None:
+    """Flip `is_active` to false in an existing poll YAML, if it is active."""
+    try:
+        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    except Exception:
+        return
+    if isinstance(data, dict) and data.get("is_active") is True:
+        data["is_active"] = False
+        write_yaml(path, data)
+
+
+# Series heuristic: normalize recurring events down to a "series key".
+#
+# Goals:
+# - Group different casings ("Fry Basket" vs "fry basket")
+# - Group editions with "#<n>" suffixes
+# - Group trailing numeric editions, including ones with parenthetical
+#   descriptors (e.g. "... 30 (Grand Stage)")
+# - Group LUTI-style division splits ("... - Division X")
+# - Group co-host variants ("... + h20")
+#
+# Uses POSIX classes to avoid backslash escaping headaches in SQL.
+#
+# The rules are folded into four passes. Order still matters: season
+# numbers must be normalized before the "<n>:" cut, and a parenthetical
+# only counts as trailing once the "+ co-host" tail is gone, so that pair
+# shares a pass. Within each pass the alternatives are all end-anchored
+# cuts, so taking the leftmost match equals applying them one by one.
+_SERIES_KEY_SQL = """
 COALESCE(
   NULLIF(
     TRIM(
       regexp_replace(
         regexp_replace(
           regexp_replace(
-            regexp_replace(
-	              regexp_replace(
-	                regexp_replace(
-	                  regexp_replace(
-	                    regexp_replace(lower(name),
-	                      '[[:space:]]*[+][[:space:]]*.*$', ''
-	                    ),
-	                    'season[[:space:]]+[0-9]+',
-	                    'season'
-	                  ),
-	                  '[[:space:]]*[(][^)]*[)][[:space:]]*$', ''
-	                ),
-                '[[:space:]]*[-][[:space:]]*division[[:space:]].*$', ''
-              ),
-              '[[:space:]]*#[[:space:]]*[0-9]+.*$', ''
+            regexp_replace(lower(name),
+              'season[[:space:]]+[0-9]+',
+              'season'
             ),
-            '[[:space:]]+[0-9]+[[:space:]]*:[[:space:]]*.*$', ''
+            '[[:space:]]*([(][^)+]*[)][[:space:]]*)?[+].*$'
+            '|[[:space:]]*[(][^)+]*[)][[:space:]]*$', ''
           ),
-          '[[:space:]]+[0-9]+[^[:alnum:]]*[[:space:]]*$', ''
+          '[[:space:]]*[-][[:space:]]*division[[:space:]].*$'
+          '|[[:space:]]*#[[:space:]]*[0-9]+.*$'
+          '|[[:space:]]+[0-9]+[[:space:]]*:[[:space:]]*.*$', ''
         ),
-        '[^[:alnum:]]+[[:space:]]*$', ''
+        '[^[:alnum:]]*([[:space:]][0-9]+)?[^[:alnum:]]*$', ''
       )
     ),
     ''
@@ -228,6 +211,27 @@ COALESCE(
 )
 """.strip()
 
+
+async def select_tournaments(
+    conn: asyncpg.Connection,
+    *,
+    schema: str,
+    since_days: int,
+    size_limit: int,
+    prestige_limit: int,
+    max_series_events: int,
+    max_polls: int | None,
+    top_participants: int,
+    winner_teams: int,
+) -> list[dict[str, Any]]:
+    """Select poll tournaments along with their top participants and winners.
+
+    Everything is computed in one statement so the participant scan is shared
+    and the whole run costs a single round trip.
+    """
+    since_ms = int((time.time() - since_days * 86400) * 1000)
+    poll_limit = int(max_polls) if max_polls and max_polls > 0 else 1_000_000
+
     sql = f"""
 WITH latest AS (
   SELECT MAX(calculated_at_ms)::bigint AS ts
@@ -251,7 +255,7 @@ t AS (
 eligible_raw AS (
   SELECT *
   FROM t
-  WHERE start_ms >= {since_ms}
+  WHERE start_ms >= $1::bigint
     AND team_count > 0
     AND users > 0
     AND match_count > 0
@@ -259,7 +263,7 @@ eligible_raw AS (
 eligible AS (
   SELECT
     *,
-    {series_key_sql}::text AS series_key
+    {_SERIES_KEY_SQL}::text AS series_key
   FROM eligible_raw
 ),
 series_ranked AS (
@@ -276,7 +280,7 @@ series_latest AS (
   SELECT *
   FROM series_ranked
   WHERE series_rn = 1
-    AND series_event_count <= {int(max_series_events)}
+    AND series_event_count <= $2::int
 ),
 ranked_ord AS (
   SELECT
@@ -302,161 +306,79 @@ strength AS (
   LEFT JOIN ranked_ord ro ON ro.player_id = p.player_id
   GROUP BY p.tournament_id
 ),
-size_pick AS (
-  SELECT tournament_id FROM (
-    (SELECT tournament_id FROM series_latest ORDER BY team_count DESC, users DESC LIMIT {size_limit})
-    UNION
-    (SELECT tournament_id FROM series_latest ORDER BY users DESC, team_count DESC LIMIT {size_limit})
-    UNION
-    (SELECT tournament_id FROM series_latest ORDER BY match_count DESC, team_count DESC LIMIT {size_limit})
-  ) x
-),
-	prestige_pick AS (
-	  SELECT tournament_id
-	  FROM strength
-	  ORDER BY top100_share DESC NULLS LAST, top100_count DESC, participant_count DESC
-	  LIMIT {prestige_limit}
-	),
-	picked AS (
-	  SELECT tournament_id FROM size_pick
-	  UNION
-	  SELECT tournament_id FROM prestige_pick
-	),
-	ranks AS (
-	  SELECT
-	    e.tournament_id::bigint AS tournament_id,
-	    ROW_NUMBER() OVER (
-	      ORDER BY e.team_count DESC, e.users DESC, e.start_ms DESC
-	    ) AS team_rn,
-	    ROW_NUMBER() OVER (
-	      ORDER BY e.users DESC, e.team_count DESC, e.start_ms DESC
-	    ) AS users_rn,
-	    ROW_NUMBER() OVER (
-	      ORDER BY e.match_count DESC, e.team_count DESC, e.start_ms DESC
-	    ) AS match_rn,
-	    ROW_NUMBER() OVER (
-	      ORDER BY s.top100_share DESC NULLS LAST,
-	               s.top100_count DESC,
-	               s.participant_count DESC
-	    ) AS prestige_rn
-	  FROM series_latest e
-	  LEFT JOIN strength s ON s.tournament_id = e.tournament_id
-	),
-	final AS (
-	  SELECT
-	    e.tournament_id,
-	    e.name,
-	    e.series_key,
-	    e.series_event_count,
-	    e.start_ms,
-	    r.team_rn,
-	    r.users_rn,
-	    r.match_rn,
-	    r.prestige_rn
-	  FROM series_latest e
-	  JOIN picked p ON p.tournament_id = e.tournament_id
-	  JOIN ranks r ON r.tournament_id = e.tournament_id
-	  ORDER BY
-	    LEAST(r.team_rn, r.users_rn, r.match_rn, r.prestige_rn) ASC,
-	    e.start_ms DESC,
-	    e.tournament_id DESC
-	  LIMIT {poll_limit}
-	)
-	SELECT
-	  tournament_id::text,
-	  name::text,
-	  series_key::text,
-	  series_event_count::text
-	FROM final
-	ORDER BY start_ms DESC, tournament_id DESC;
-	"""
-
-    rows = run_psql(conn, sql, extra_env=extra_env)
-    return [
-        {
-            "tournament_id": int(tid),
-            "name": name,
-            "series_key": series_key,
-            "series_event_count": int(series_event_count)
-            if str(series_event_count).strip()
-            else None,
-        }
-        for tid, name, series_key, series_event_count in rows
-    ]
-
-
-def fetch_top_participants(
-    conn: str,
-    *,
-    extra_env: Mapping[str, str],
-    schema: str,
-    tournament_ids: Sequence[int],
-    limit: int,
-) -> dict[int, list[str]]:
-    if not tournament_ids:
-        return {}
-
-    ids_sql = ",".join(str(int(t)) for t in tournament_ids)
-    sql = f"""
-WITH latest AS (
-  SELECT MAX(calculated_at_ms)::bigint AS ts
-  FROM "{schema}".player_rankings
+-- A tournament is picked if it is top-N on any size metric or top-N by
+-- elite density; all four rankings come out of one pass over series_latest.
+ranks AS (
+  SELECT
+    e.tournament_id::bigint AS tournament_id,
+    s.participant_count,
+    ROW_NUMBER() OVER (
+      ORDER BY e.team_count DESC, e.users DESC, e.start_ms DESC
+    ) AS team_rn,
+    ROW_NUMBER() OVER (
+      ORDER BY e.users DESC, e.team_count DESC, e.start_ms DESC
+    ) AS users_rn,
+    ROW_NUMBER() OVER (
+      ORDER BY e.match_count DESC, e.team_count DESC, e.start_ms DESC
+    ) AS match_rn,
+    ROW_NUMBER() OVER (
+      ORDER BY s.top100_share DESC NULLS LAST,
+               s.top100_count DESC,
+               s.participant_count DESC
+    ) AS prestige_rn
+  FROM series_latest e
+  LEFT JOIN strength s ON s.tournament_id = e.tournament_id
 ),
-participants AS (
-  SELECT DISTINCT tournament_id::bigint AS tournament_id,
-                  player_id::bigint AS player_id
-  FROM "{schema}".player_appearance_teams
-  WHERE tournament_id = ANY(string_to_array('{ids_sql}', ',')::bigint[])
+final AS (
+  SELECT
+    e.tournament_id,
+    e.name,
+    e.series_key,
+    e.series_event_count,
+    e.start_ms,
+    r.team_rn,
+    r.users_rn,
+    r.match_rn,
+    r.prestige_rn
+  FROM series_latest e
+  JOIN ranks r ON r.tournament_id = e.tournament_id
+  WHERE LEAST(r.team_rn, r.users_rn, r.match_rn) <= $3::int
+     OR (r.prestige_rn <= $4::int AND r.participant_count IS NOT NULL)
+  ORDER BY
+    LEAST(r.team_rn, r.users_rn, r.match_rn, r.prestige_rn) ASC,
+    e.start_ms DESC,
+    e.tournament_id DESC
+  LIMIT $5::int
 ),
-scored AS (
+top_scored AS (
   SELECT
     p.tournament_id,
     COALESCE(pl.display_name, '(unknown)')::text AS display_name,
-    pr.score::double precision AS score,
     ROW_NUMBER() OVER (
       PARTITION BY p.tournament_id
       ORDER BY pr.score DESC NULLS LAST, pl.display_name ASC, p.player_id ASC
     ) AS rn
   FROM participants p
+  JOIN final f ON f.tournament_id = p.tournament_id
   LEFT JOIN "{schema}".players pl ON pl.player_id = p.player_id
   LEFT JOIN "{schema}".player_rankings pr
     ON pr.player_id = p.player_id
    AND pr.calculated_at_ms = (SELECT ts FROM latest)
-)
-SELECT tournament_id::text, display_name
-FROM scored
-WHERE rn <= {int(limit)}
-ORDER BY tournament_id::bigint, rn::int;
-"""
-
-    rows = run_psql(conn, sql, extra_env=extra_env)
-    out: dict[int, list[str]] = {}
-    for tid_str, display_name in rows:
-        out.setdefault(int(tid_str), []).append(display_name)
-    return out
-
-
-def fetch_winner_teams(
-    conn: str,
-    *,
-    extra_env: Mapping[str, str],
-    schema: str,
-    tournament_ids: Sequence[int],
-    limit: int,
-) -> dict[int, list[str]]:
-    if not tournament_ids:
-        return {}
-
-    ids_sql = ",".join(str(int(t)) for t in tournament_ids)
-    sql = f"""
-WITH matches_clean AS (
+),
+top_part AS (
+  SELECT tournament_id, array_agg(display_name ORDER BY rn) AS names
+  FROM top_scored
+  WHERE rn <= $6::int
+  GROUP BY tournament_id
+),
+matches_clean AS (
   SELECT
-    tournament_id::bigint AS tournament_id,
-    winner_team_id::bigint AS winner_team_id,
-    loser_team_id::bigint  AS loser_team_id
-  FROM "{schema}".matches
-  WHERE tournament_id = ANY(string_to_array('{ids_sql}', ',')::bigint[])
-    AND COALESCE(is_bye, FALSE) IS FALSE
+    m.tournament_id::bigint AS tournament_id,
+    m.winner_team_id::bigint AS winner_team_id,
+    m.loser_team_id::bigint  AS loser_team_id
+  FROM "{schema}".matches m
+  JOIN final f ON f.tournament_id = m.tournament_id
+  WHERE COALESCE(m.is_bye, FALSE) IS FALSE
 ),
 wins AS (
   SELECT tournament_id, winner_team_id AS team_id, COUNT(*)::int AS wins
@@ -473,32 +395,77 @@ losses AS (
 team_stats AS (
   SELECT
     tt.tournament_id::bigint AS tournament_id,
-    tt.team_id::bigint AS team_id,
     COALESCE(tt.name, '(unknown)')::text AS team_name,
-    COALESCE(w.wins, 0)::int AS wins,
-    COALESCE(l.losses, 0)::int AS losses,
     ROW_NUMBER() OVER (
       PARTITION BY tt.tournament_id
       ORDER BY COALESCE(w.wins, 0) DESC, COALESCE(l.losses, 0) ASC, tt.name ASC
     ) AS rn
   FROM "{schema}".tournament_teams tt
+  JOIN final f ON f.tournament_id = tt.tournament_id
   LEFT JOIN wins w
     ON w.tournament_id = tt.tournament_id AND w.team_id = tt.team_id
   LEFT JOIN losses l
     ON l.tournament_id = tt.tournament_id AND l.team_id = tt.team_id
-  WHERE tt.tournament_id = ANY(string_to_array('{ids_sql}', ',')::bigint[])
+),
+win_part AS (
+  SELECT tournament_id, array_agg(team_name ORDER BY rn) AS teams
+  FROM team_stats
+  WHERE rn <= $7::int
+  GROUP BY tournament_id
 )
-SELECT tournament_id::text, team_name
-FROM team_stats
-WHERE rn <= {int(limit)}
-ORDER BY tournament_id::bigint, rn::int;
+SELECT
+  f.tournament_id,
+  f.name,
+  f.series_key,
+  f.series_event_count,
+  COALESCE(tp.names, ARRAY[]::text[]) AS top_participants,
+  COALESCE(wp.teams, ARRAY[]::text[]) AS winners
+FROM final f
+LEFT JOIN top_part tp ON tp.tournament_id = f.tournament_id
+LEFT JOIN win_part wp ON wp.tournament_id = f.tournament_id
+ORDER BY f.start_ms DESC, f.tournament_id DESC;
 """
 
-    rows = run_psql(conn, sql, extra_env=extra_env)
-    out: dict[int, list[str]] = {}
-    for tid_str, team_name in rows:
-        out.setdefault(int(tid_str), []).append(team_name)
-    return out
+    # Only the (validated) schema name is interpolated; everything else is
+    # bound so the statement text stays identical between runs.
+    # asyncpg decodes the binary wire format straight into int/str/list, so
+    # the rows need no further coercion.
+    rows = await conn.fetch(
+        sql,
+        since_ms,
+        int(max_series_events),
+        int(size_limit),
+        int(prestige_limit),
+        poll_limit,
+        int(top_participants),
+        int(winner_teams),
+    )
+    return [dict(row) for row in rows]
+
+
+async def fetch_poll_data(
+    args: argparse.Namespace,
+    *,
+    schema: str,
+) -> list[dict[str, Any]]:
+    """Run the poll selection query over a single short-lived connection."""
+    conn = await asyncpg.connect(
+        server_settings=_SERVER_SETTINGS, **build_connect_kwargs()
+    )
+    try:
+        return await select_tournaments(
+            conn,
+            schema=schema,
+            since_days=int(args.since_days),
+            size_limit=int(args.size_limit),
+            prestige_limit=int(args.prestige_limit),
+            max_series_events=int(args.max_series_events),
+            max_polls=int(args.max_polls) if args.max_polls is not None else None,
+            top_participants=int(args.top_participants),
+            winner_teams=int(args.winner_teams),
+        )
+    finally:
+        await conn.close()
 
 
 def main() -> None:
@@ -582,56 +549,23 @@ def main() -> None:
         load_env_file(args.env_file)
 
     schema = resolve_schema()
-    conn, extra_env = build_psql_conn_args()
-
-    tournaments = select_tournaments(
-        conn,
-        extra_env=extra_env,
-        schema=schema,
-        since_days=int(args.since_days),
-        size_limit=int(args.size_limit),
-        prestige_limit=int(args.prestige_limit),
-        max_series_events=int(args.max_series_events),
-        max_polls=int(args.max_polls) if args.max_polls is not None else None,
-    )
-
-    tournament_ids = [int(t["tournament_id"]) for t in tournaments]
-    top_participants = fetch_top_participants(
-        conn,
-        extra_env=extra_env,
-        schema=schema,
-        tournament_ids=tournament_ids,
-        limit=int(args.top_participants),
-    )
-    winner_teams = fetch_winner_teams(
-        conn,
-        extra_env=extra_env,
-        schema=schema,
-        tournament_ids=tournament_ids,
-        limit=int(args.winner_teams),
-    )
+    tournaments = asyncio.run(fetch_poll_data(args, schema=schema))
 
     out_dir: Path = args.out_dir
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    selected_ids = {int(t["tournament_id"]) for t in tournaments}
+    selected_ids = frozenset(t["tournament_id"] for t in tournaments)
+    stale: list[Path] = []
     if args.deactivate_unselected:
         for existing in out_dir.glob("tournament_tier_poll_sendou_*.yaml"):
-            match = re.search(r"_sendou_(\d+)\.yaml$", existing.name)
+            match = _SENDOU_ID_RE.search(existing.name)
             if not match:
                 continue
-            tid = int(match.group(1))
-            if tid in selected_ids:
+            if int(match.group(1)) in selected_ids:
                 continue
-            try:
-                data = yaml.safe_load(existing.read_text(encoding="utf-8")) or {}
-            except Exception:
-                continue
-            if isinstance(data, dict) and data.get("is_active") is True:
-                data["is_active"] = False
-                write_yaml(existing, data)
+            stale.append(existing)
 
-    written = 0
+    pending: list[tuple[Path, dict[str, Any]]] = []
     skipped = 0
     for t in tournaments:
         tid = int(t["tournament_id"])
@@ -656,15 +590,21 @@ def main() -> None:
                     "id": f"sendou-{tid}",
                     "url": f"https://sendou.ink/to/{tid}/brackets",
                     "top_participants": [
-                        {"name": p} for p in top_participants.get(tid, [])
+                        {"name": p} for p in t["top_participants"]
                     ],
-                    "winners": [{"name": w} for w in winner_teams.get(tid, [])],
+                    "winners": [{"name": w} for w in t["winners"]],
                 },
             },
         }
-
-        write_yaml(file_path, category)
-        written += 1
+        pending.append((file_path, category))
+
+    # Encoding and writing are independent per file; overlap them in threads.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+        futures = [ex.submit(deactivate_poll_file, path) for path in stale]
+        futures += [ex.submit(write_yaml, path, data) for path, data in pending]
+        for future in futures:
+            future.result()
+    written = len(pending)
 
     print(
         f"Generated {written} poll YAMLs in {out_dir} (skipped {skipped}).",
@@ -1,8 +1,15 @@
 """Database connection utilities."""
 
 import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Union
 
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
+
+@lru_cache(maxsize=4)
 def get_database_uri(async_driver: bool = True) -> str:
     """Build database URI from environment variables."""
     host = os.getenv("DB_HOST", "localhost")
@@ -24,6 +31,81 @@ def get_database_uri(async_driver: bool = True) -> str:
     return uri
 
 
+@lru_cache(maxsize=2)
+def get_engine(async_driver: bool = True) -> Union["AsyncEngine", "Engine"]:
+    """Return the process-wide SQLAlchemy engine for the given driver.
+
+    Built once per process so the dialect import and pool construction are
+    paid a single time and warm connections are reused across callers.
+    """
+    kwargs: dict = {
+        "echo": os.getenv("DB_ECHO", "false").lower() == "true",
+        # Off by default: it costs a round-trip per checkout, and
+        # pool_recycle already retires connections before idle timeouts.
+        "pool_pre_ping": os.getenv("DB_POOL_PRE_PING", "false").lower() == "true",
+    }
+    pgbouncer = os.getenv("PGBOUNCER", "0") == "1"
+    if pgbouncer:
+        # pgbouncer (transaction mode) does the pooling; don't hold
+        # connections on our side as well.
+        from sqlalchemy.pool import NullPool
+
+        kwargs["poolclass"] = NullPool
+    else:
+        # Per worker; keep workers * (size + overflow) under Postgres'
+        # max_connections. A short timeout fails fast instead of queueing
+        # requests behind a saturated pool.
+        kwargs.update(
+            pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+            max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "40")),
+            pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "5")),
+            pool_recycle=1800,
+            pool_use_lifo=True,
+        )
+    if async_driver:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        if pgbouncer:
+            # Prepared statements live on one backend, and transaction-mode
+            # pgbouncer hands out a different one per transaction. Turn off
+            # both the dialect's and asyncpg's statement caches, and give
+            # each statement a unique name so they can't collide.
+            from uuid import uuid4
+
+            kwargs["connect_args"] = {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        else:
+            # Per-connection cache of prepared statements for the hot queries
+            # (asyncpg dialect default is 100)
+            kwargs["connect_args"] = {
+                "prepared_statement_cache_size": int(
+                    os.getenv("DB_STATEMENT_CACHE_SIZE", "500")
+                )
+            }
+
+        return create_async_engine(get_database_uri(async_driver=True), **kwargs)
+
+    from sqlalchemy import create_engine
+
+    return create_engine(get_database_uri(async_driver=False), **kwargs)
+
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> "async_sessionmaker[AsyncSession]":
+    """Return the process-wide async session factory bound to `get_engine()`."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+    return async_sessionmaker(
+        get_engine(async_driver=True),
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+
 def get_redis_url() -> str:
     """Build Redis URL from environment variables."""
     host = os.getenv("REDIS_HOST", "localhost")
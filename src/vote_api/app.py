@@ -1,14 +1,17 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy import text
 
-from vote_api.connections import async_engine, db_context
-from vote_api.middleware import RateLimitMiddleware
+from vote_api.connections import async_engine, db_context, get_redis_cache
+from vote_api.middleware import RateLimitMiddleware, preload_rate_limit_script
+from vote_api.responses import ORJSONResponse
 from vote_api.routes import (
     admin_router,
     auth_router,
@@ -17,6 +20,7 @@ from vote_api.routes import (
     results_router,
     votes_router,
 )
+from vote_api.services.category_cache import CategoryCache
 from vote_api.services.category_sync import CategorySyncService
 
 # Setup logging
@@ -27,6 +31,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+DB_WARMUP_CONNECTIONS = int(os.getenv("DB_WARMUP_CONNECTIONS", "5"))
+
+
+async def _ping_db() -> None:
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def warm_up() -> None:
+    """Open pooled DB connections and load Redis scripts before serving."""
+    results = await asyncio.gather(
+        *(_ping_db() for _ in range(DB_WARMUP_CONNECTIONS)),
+        preload_rate_limit_script(),
+        return_exceptions=True,
+    )
+    for error in results:
+        if isinstance(error, Exception):
+            logger.warning(f"Startup warmup step failed: {error}")
+    logger.info(f"DB pool after warmup: {async_engine.pool.status()}")
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -49,9 +73,12 @@ async def lifespan(app: FastAPI):
                 sync_service = CategorySyncService(session)
                 results = await sync_service.sync_all()
                 logger.info(f"Category sync completed: {results}")
+            await CategoryCache(get_redis_cache()).invalidate()
         except Exception:
             logger.exception("Category sync failed on startup")
 
+    await warm_up()
+
     yield
 
     # Cleanup on shutdown
@@ -65,6 +92,7 @@ app = FastAPI(
     description="Community voting platform for Splatoon 3",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add middleware
@@ -103,4 +131,13 @@ async def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8001, log_level="info")
+    # Workers require an import string rather than the app object
+    uvicorn.run(
+        "vote_api.app:app",
+        host="0.0.0.0",
+        port=8001,
+        log_level="info",
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "2")),
+    )
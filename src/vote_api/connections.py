@@ -1,30 +1,18 @@
 """Database and Redis connection management."""
 
-import os
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-import redis
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
+import redis.asyncio as aioredis
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from shared_lib.db import get_database_uri, get_redis_url
+from shared_lib.db import get_engine, get_redis_url, get_sessionmaker
 
-# Async database engine
-async_engine = create_async_engine(
-    get_database_uri(async_driver=True),
-    echo=os.getenv("DB_ECHO", "false").lower() == "true",
-    pool_pre_ping=True,
-    poolclass=NullPool,  # Use NullPool for better async compatibility
-)
+# Async database engine (pooled; see shared_lib.db.get_engine)
+async_engine = get_engine(async_driver=True)
 
 # Session factory
-async_session_factory = async_sessionmaker(
-    async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-)
+async_session_factory = get_sessionmaker()
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
@@ -36,19 +24,33 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-# Redis connection pool
-redis_pool = redis.ConnectionPool.from_url(
-    get_redis_url(),
-    max_connections=10,
-    decode_responses=True,
-)
+def _redis_pool(max_connections: int) -> aioredis.ConnectionPool:
+    return aioredis.ConnectionPool.from_url(
+        get_redis_url(),
+        max_connections=max_connections,
+        decode_responses=True,
+    )
 
-redis_client = redis.Redis(connection_pool=redis_pool)
 
+# Redis connection pools (async). The rate limiter runs on every API request,
+# so it gets its own pool that cache traffic can't starve during bursts.
+# Everything else (caches, anti-manipulation tracking, readiness probe) shares
+# the second pool.
+_rl_pool = _redis_pool(50)
+_cache_pool = _redis_pool(30)
 
-def get_redis() -> redis.Redis:
-    """Get Redis client."""
-    return redis_client
+_rl_client = aioredis.Redis(connection_pool=_rl_pool)
+_cache_client = aioredis.Redis(connection_pool=_cache_pool)
+
+
+def get_redis_rl() -> aioredis.Redis:
+    """Get Redis client reserved for the rate-limit middleware."""
+    return _rl_client
+
+
+def get_redis_cache() -> aioredis.Redis:
+    """Get Redis client for caches and other non-rate-limit traffic."""
+    return _cache_client
 
 
 @asynccontextmanager
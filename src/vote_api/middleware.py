@@ -4,17 +4,79 @@ import hashlib
 import logging
 import os
 import time
+from functools import lru_cache
 from typing import Callable
 
 from fastapi import Request, Response
+from redis.exceptions import NoScriptError
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
 
-from vote_api.connections import get_redis
+from vote_api.connections import get_redis_rl
+from vote_api.responses import ORJSONResponse
 from vote_api.services.fingerprint import get_client_ip
 
 logger = logging.getLogger(__name__)
 
+# Atomic token buckets, all-or-nothing: a token is taken from every bucket
+# only when every bucket has one, so a request rejected by one limit isn't
+# charged against the others. KEYS = bucket hashes; ARGV = now (ms), cost,
+# then capacity and refill rate (tokens/ms) per key. Returns, per key,
+# {allowed, remaining tokens, ms until retry (0 if allowed), ms until full}.
+_TOKEN_BUCKET_LUA = """
+local now = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+
+local capacities, rates, tokens = {}, {}, {}
+local all_allowed = true
+for i, key in ipairs(KEYS) do
+  local capacity = tonumber(ARGV[2 * i + 1])
+  local rate = tonumber(ARGV[2 * i + 2])
+  local state = redis.call('HMGET', key, 'tokens', 'ts')
+  local t = tonumber(state[1]) or capacity
+  local ts = tonumber(state[2]) or now
+  t = math.min(capacity, t + math.max(0, now - ts) * rate)
+  capacities[i], rates[i], tokens[i] = capacity, rate, t
+  if t < cost then
+    all_allowed = false
+  end
+end
+
+local results = {}
+for i, key in ipairs(KEYS) do
+  local t = tokens[i]
+  local allowed = 0
+  local retry_ms = 0
+  if t >= cost then
+    allowed = 1
+  else
+    retry_ms = math.ceil((cost - t) / rates[i])
+  end
+  if all_allowed then
+    t = t - cost
+  end
+  local full_ms = math.ceil((capacities[i] - t) / rates[i])
+  redis.call('HSET', key, 'tokens', t, 'ts', now)
+  redis.call('PEXPIRE', key, full_ms + 1000)
+  results[i] = {allowed, math.floor(t), retry_ms, full_ms}
+end
+return results
+"""
+_TOKEN_BUCKET_SHA = hashlib.sha1(_TOKEN_BUCKET_LUA.encode()).hexdigest()
+
+_RATE_LIMITED_PREFIXES = ("/api/",)
+_VOTE_PREFIXES = ("/api/v1/vote",)
+
+
+async def preload_rate_limit_script() -> None:
+    """Load the token-bucket script so the first EVALSHA doesn't miss."""
+    await get_redis_rl().script_load(_TOKEN_BUCKET_LUA)
+
+
+@lru_cache(maxsize=8192)
+def _hash_ip(ip: str) -> str:
+    """Short, stable rate-limit key for an IP (64-bit BLAKE2b)."""
+    return hashlib.blake2b(ip.encode(), digest_size=8).hexdigest()
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """Rate limiting middleware for vote endpoints."""
@@ -26,50 +88,90 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def _identity(self, request: Request) -> str:
         """Get rate limit identity from request."""
-        ip = get_client_ip(request)
-        return hashlib.sha256(ip.encode()).hexdigest()[:16]
+        ident = getattr(request.state, "rl_identity", None)
+        if ident is None:
+            ident = _hash_ip(get_client_ip(request))
+            request.state.rl_identity = ident
+        return ident
+
+    async def _take_tokens(
+        self, buckets: list[tuple[str, int, float]]
+    ) -> list[list[int]]:
+        """Take one token from each (key, capacity, window_ms) bucket.
+
+        All buckets are checked and charged together in one EVALSHA.
+        """
+        redis_client = get_redis_rl()
+        now_ms = time.time_ns() // 1_000_000
+        args: list[float] = [now_ms, 1]
+        for _, capacity, window_ms in buckets:
+            args += (capacity, capacity / window_ms)
+        keys = [key for key, _, _ in buckets]
+        try:
+            return await redis_client.evalsha(
+                _TOKEN_BUCKET_SHA, len(keys), *keys, *args
+            )
+        except NoScriptError:
+            # Script cache was flushed (or a fresh server); load and retry.
+            await redis_client.script_load(_TOKEN_BUCKET_LUA)
+            return await redis_client.evalsha(
+                _TOKEN_BUCKET_SHA, len(keys), *keys, *args
+            )
+
+    @staticmethod
+    def _with_headers(
+        response: Response, capacity: int, result: list[int]
+    ) -> Response:
+        _, remaining, retry_ms, full_ms = result
+        response.headers["X-RateLimit-Limit"] = str(capacity)
+        response.headers["X-RateLimit-Remaining"] = str(remaining)
+        response.headers["X-RateLimit-Reset"] = str(-(-full_ms // 1000))
+        return response
+
+    def _limited(self, detail: str, capacity: int, result: list[int]) -> Response:
+        response = self._with_headers(
+            ORJSONResponse(status_code=429, content={"detail": detail}),
+            capacity,
+            result,
+        )
+        response.headers["Retry-After"] = str(max(1, -(-result[2] // 1000)))
+        return response
 
     async def dispatch(
         self, request: Request, call_next: Callable
     ) -> Response:
-        path = request.url.path
-
-        # Apply stricter limits to vote endpoints
-        if path.startswith("/api/v1/vote") and request.method == "POST":
-            ident = self._identity(request)
-            now = int(time.time())
-            vote_key = f"vote:rl:min:{ident}:{now // 60}"
-
-            try:
-                redis_client = get_redis()
-                count = redis_client.incr(vote_key)
-                redis_client.expire(vote_key, 120)
-
-                if count > self.votes_per_minute:
-                    return JSONResponse(
-                        status_code=429,
-                        content={"detail": "Vote rate limit exceeded"},
-                    )
-            except Exception as e:
-                logger.warning(f"Vote rate limiting unavailable: {e}")
-
-        # Apply general rate limiting to all API endpoints
-        if path.startswith("/api/"):
-            ident = self._identity(request)
-            now = int(time.time())
-            sec_key = f"vote:rl:sec:{ident}:{now}"
-
-            try:
-                redis_client = get_redis()
-                count = redis_client.incr(sec_key)
-                redis_client.expire(sec_key, 2)
-
-                if count > self.requests_per_second:
-                    return JSONResponse(
-                        status_code=429,
-                        content={"detail": "Rate limit exceeded"},
-                    )
-            except Exception as e:
-                logger.warning(f"API rate limiting unavailable: {e}")
-
-        return await call_next(request)
+        # Read the raw scope path rather than building request.url. Docs,
+        # probes and CORS preflights never touch Redis.
+        path = request.scope["path"]
+        method = request.method
+        if method == "OPTIONS" or not path.startswith(_RATE_LIMITED_PREFIXES):
+            return await call_next(request)
+
+        ident = self._identity(request)
+        is_vote = method == "POST" and path.startswith(_VOTE_PREFIXES)
+
+        # Apply general rate limiting to all API endpoints, and stricter
+        # limits to vote endpoints
+        buckets = [(f"vote:rl:api:{ident}", self.requests_per_second, 1000)]
+        if is_vote:
+            buckets.append((f"vote:rl:vote:{ident}", self.votes_per_minute, 60000))
+
+        try:
+            results = await self._take_tokens(buckets)
+        except Exception as e:
+            logger.warning(f"API rate limiting unavailable: {e}")
+            return await call_next(request)
+
+        if is_vote and not results[1][0]:
+            return self._limited(
+                "Vote rate limit exceeded", self.votes_per_minute, results[1]
+            )
+        if not results[0][0]:
+            return self._limited(
+                "Rate limit exceeded", self.requests_per_second, results[0]
+            )
+
+        response = await call_next(request)
+        if is_vote:
+            return self._with_headers(response, self.votes_per_minute, results[1])
+        return self._with_headers(response, self.requests_per_second, results[0])
@@ -9,13 +9,18 @@ from vote_api.models.database import (
     ItemGroup,
     Vote,
     VoteChoice,
+    VoteTally,
 )
 from vote_api.models.enums import ComparisonMode
 from vote_api.models.schemas import (
+    AdminCategoryBrief,
+    AdminCategoryListResponse,
     CategoryResponse,
     CommentRequest,
     ItemResponse,
     ItemResultResponse,
+    PendingCommentListResponse,
+    PendingCommentResponse,
     ResultsResponse,
     VoteRequest,
     VoteResponse,
@@ -30,6 +35,7 @@ __all__ = [
     "CategoryItem",
     "Vote",
     "VoteChoice",
+    "VoteTally",
     "Comment",
     "EloRating",
     "ComparisonMode",
@@ -41,4 +47,8 @@ __all__ = [
     "ResultsResponse",
     "ItemResultResponse",
     "CommentRequest",
+    "AdminCategoryBrief",
+    "AdminCategoryListResponse",
+    "PendingCommentResponse",
+    "PendingCommentListResponse",
 ]
@@ -4,14 +4,20 @@ from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
+    PrimaryKeyConstraint,
     String,
     Text,
     UniqueConstraint,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -42,7 +48,10 @@ class Item(Base):
     """Individual items that can be voted on."""
 
     __tablename__ = "items"
-    __table_args__ = {"schema": "voting"}
+    __table_args__ = (
+        Index("idx_items_group", "group_id"),
+        {"schema": "voting"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     group_id: Mapped[Optional[int]] = mapped_column(
@@ -73,7 +82,11 @@ class Category(Base):
     """Voting categories with different comparison modes."""
 
     __tablename__ = "categories"
-    __table_args__ = {"schema": "voting"}
+    __table_args__ = (
+        Index("idx_categories_soft_deleted", "is_soft_deleted"),
+        Index("idx_categories_active_created", "is_active", "created_at"),
+        {"schema": "voting"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -85,7 +98,7 @@ class Category(Base):
     )
     settings: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -126,17 +139,27 @@ class Vote(Base):
         UniqueConstraint(
             "category_id", "fingerprint_hash", name="uq_vote_per_fingerprint"
         ),
+        Index("idx_votes_category", "category_id"),
+        Index(
+            "idx_votes_fingerprint_category",
+            "fingerprint_hash",
+            "category_id",
+            postgresql_include=["id", "created_at"],
+        ),
+        Index("idx_votes_category_created", "category_id", "created_at"),
+        Index("idx_votes_created_brin", "created_at", postgresql_using="brin"),
         {"schema": "voting"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     category_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("voting.categories.id"), nullable=False
     )
-    fingerprint_hash: Mapped[str] = mapped_column(String(64), nullable=False)
-    ip_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # Raw digests (BYTEA): 32-byte client SHA-256, 16-byte keyed BLAKE2s of the IP
+    fingerprint_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
+    ip_hash: Mapped[bytes] = mapped_column(LargeBinary(16), nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -155,12 +178,18 @@ class VoteChoice(Base):
     __tablename__ = "vote_choices"
     __table_args__ = (
         UniqueConstraint("vote_id", "item_id", name="uq_choice_per_vote"),
+        Index(
+            "idx_vote_choices_vote",
+            "vote_id",
+            postgresql_include=["item_id", "rank"],
+        ),
+        Index("idx_vote_choices_item", "item_id"),
         {"schema": "voting"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
     vote_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("voting.votes.id"), nullable=False
+        BigInteger, ForeignKey("voting.votes.id"), nullable=False
     )
     item_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("voting.items.id"), nullable=False
@@ -172,20 +201,51 @@ class VoteChoice(Base):
     item: Mapped["Item"] = relationship("Item", back_populates="vote_choices")
 
 
+class VoteTally(Base):
+    """Per-category vote counts, maintained at write time.
+
+    One row per (category, item, rank) bucket; rank is 0 for unranked
+    choices, the position for ranked lists and the tier index for tier
+    polls. Always equal to counting vote_choices grouped the same way.
+    """
+
+    __tablename__ = "vote_tallies"
+    __table_args__ = (
+        PrimaryKeyConstraint("category_id", "item_id", "rank"),
+        {"schema": "voting"},
+    )
+
+    category_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("voting.categories.id"), nullable=False
+    )
+    item_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("voting.items.id"), nullable=False
+    )
+    rank: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    vote_count: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+
+
 class Comment(Base):
     """Optional comments on votes."""
 
     __tablename__ = "comments"
-    __table_args__ = {"schema": "voting"}
+    __table_args__ = (
+        Index(
+            "idx_comments_pending",
+            text("created_at DESC"),
+            postgresql_where=text("is_approved = false"),
+        ),
+        {"schema": "voting"},
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     vote_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("voting.votes.id"), nullable=False, unique=True
+        BigInteger, ForeignKey("voting.votes.id"), nullable=False, unique=True
     )
     content: Mapped[str] = mapped_column(Text, nullable=False)
     is_approved: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     # Relationships
@@ -198,6 +258,13 @@ class EloRating(Base):
     __tablename__ = "elo_ratings"
     __table_args__ = (
         UniqueConstraint("category_id", "item_id", name="uq_elo_per_item"),
+        Index("idx_elo_category", "category_id"),
+        Index(
+            "idx_elo_category_rating",
+            "category_id",
+            "rating",
+            postgresql_include=["item_id", "games_played"],
+        ),
         {"schema": "voting"},
     )
 
@@ -211,7 +278,10 @@ class EloRating(Base):
     rating: Mapped[float] = mapped_column(Float, default=1500.0, nullable=False)
     games_played: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
 
     # Relationships
@@ -103,6 +103,46 @@ class ResultsResponse(BaseModel):
     results: list[ItemResultResponse]
 
 
+class AdminCategoryBrief(BaseModel):
+    """Category row in the admin listing."""
+
+    id: int
+    name: str
+    description: Optional[str] = None
+    comparison_mode: str
+    is_active: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AdminCategoryListResponse(BaseModel):
+    """Admin listing of categories, including inactive ones."""
+
+    categories: list[AdminCategoryBrief]
+    total: int
+
+
+class PendingCommentResponse(BaseModel):
+    """Comment awaiting moderation."""
+
+    id: int
+    vote_id: int
+    content: str
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class PendingCommentListResponse(BaseModel):
+    """Comments awaiting moderation."""
+
+    comments: list[PendingCommentResponse]
+    total: int
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
@@ -1,38 +1,71 @@
 """Admin endpoints for category management and moderation."""
 
 import hashlib
+import hmac
 import os
-from typing import Any
+from typing import Any, Optional
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header
-from sqlalchemy import select, update
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, Query
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from vote_api.connections import db_context, get_db_session
+from vote_api.connections import db_context, get_db_session, get_redis_cache
 from vote_api.models.database import Category, Comment
+from vote_api.models.schemas import (
+    AdminCategoryBrief,
+    AdminCategoryListResponse,
+    PendingCommentListResponse,
+    PendingCommentResponse,
+)
+from vote_api.services.category_cache import CategoryCache
 from vote_api.services.category_sync import CategorySyncService
 
 router = APIRouter(prefix="/api/v1/admin", tags=["admin"])
 
+# Parsed once at import; token config only changes with a redeploy.
+_ADMIN_TOKEN_HASHES = frozenset(
+    h.strip() for h in os.getenv("ADMIN_API_TOKENS_HASHED", "").split(",") if h.strip()
+)
+_ADMIN_TOKEN_PEPPER = os.getenv("ADMIN_TOKEN_PEPPER", os.getenv("VOTE_IP_PEPPER", ""))
+
 
 def verify_admin_token(x_admin_token: str = Header(...)) -> bool:
     """Verify admin token from header."""
-    admin_tokens_hashed = os.getenv("ADMIN_API_TOKENS_HASHED", "")
-    if not admin_tokens_hashed:
+    if not _ADMIN_TOKEN_HASHES:
         raise HTTPException(status_code=503, detail="Service not configured")
 
     # Hash the provided token with pepper
-    pepper = os.getenv("ADMIN_TOKEN_PEPPER", os.getenv("VOTE_IP_PEPPER", ""))
-    token_hash = hashlib.sha256((pepper + x_admin_token).encode()).hexdigest()
-
-    # Check if hash matches any configured admin token
-    valid_hashes = [h.strip() for h in admin_tokens_hashed.split(",")]
-    if token_hash not in valid_hashes:
+    token_hash = hashlib.sha256(
+        (_ADMIN_TOKEN_PEPPER + x_admin_token).encode()
+    ).hexdigest()
+
+    # Constant-time check against every configured admin token
+    matched = False
+    for valid_hash in _ADMIN_TOKEN_HASHES:
+        matched |= hmac.compare_digest(token_hash, valid_hash)
+    if not matched:
         raise HTTPException(status_code=401, detail="Invalid admin token")
 
     return True
 
 
+async def _page_total(
+    session: AsyncSession, rows: list, offset: int, model: type, condition
+) -> int:
+    """Unpaginated total for a page selected with a `total` window count.
+
+    An empty page past the end has no row to carry the window count, so the
+    total is counted directly.
+    """
+    if rows:
+        return rows[0].total
+    if not offset:
+        return 0
+    return await session.scalar(
+        select(func.count()).select_from(model).where(condition)
+    )
+
+
 @router.post("/sync")
 async def trigger_sync(
     background_tasks: BackgroundTasks,
@@ -44,6 +77,7 @@ async def trigger_sync(
         async with db_context() as session:
             sync_service = CategorySyncService(session)
             await sync_service.sync_all()
+        await CategoryCache(get_redis_cache()).invalidate()
 
     background_tasks.add_task(do_sync)
     return {"status": "sync_initiated", "message": "Category sync started in background"}
@@ -57,36 +91,32 @@ async def trigger_sync_blocking(
     """Trigger category sync and wait for completion."""
     sync_service = CategorySyncService(session)
     results = await sync_service.sync_all()
+    await CategoryCache(get_redis_cache()).invalidate()
     return {"status": "completed", "results": results}
 
 
-@router.get("/categories")
+@router.get("/categories", response_model=AdminCategoryListResponse)
 async def list_all_categories(
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     _: bool = Depends(verify_admin_token),
     session: AsyncSession = Depends(get_db_session),
-) -> dict[str, Any]:
-    """List all categories including inactive ones."""
+) -> AdminCategoryListResponse:
+    """List all categories including inactive ones, optionally paginated."""
+    not_deleted = Category.is_soft_deleted == False
     result = await session.execute(
-        select(Category)
-        .where(Category.is_soft_deleted == False)
+        select(Category, func.count().over().label("total"))
+        .where(not_deleted)
         .order_by(Category.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = result.all()
+
+    return AdminCategoryListResponse(
+        categories=[AdminCategoryBrief.model_validate(row.Category) for row in rows],
+        total=await _page_total(session, rows, offset, Category, not_deleted),
     )
-    categories = list(result.scalars().all())
-
-    return {
-        "categories": [
-            {
-                "id": cat.id,
-                "name": cat.name,
-                "description": cat.description,
-                "comparison_mode": cat.comparison_mode,
-                "is_active": cat.is_active,
-                "created_at": cat.created_at.isoformat(),
-            }
-            for cat in categories
-        ],
-        "total": len(categories),
-    }
 
 
 @router.put("/categories/{category_id}")
@@ -98,47 +128,46 @@ async def update_category(
 ) -> dict[str, Any]:
     """Update category status."""
     result = await session.execute(
-        select(Category).where(
+        update(Category)
+        .where(
             Category.id == category_id,
             Category.is_soft_deleted == False,
         )
+        .values(is_active=is_active)
+        .returning(Category.id)
     )
-    category = result.scalar_one_or_none()
 
-    if not category:
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Category not found")
 
-    category.is_active = is_active
     await session.commit()
+    await CategoryCache(get_redis_cache()).invalidate()
 
     return {"success": True, "message": f"Category {'activated' if is_active else 'deactivated'}"}
 
 
-@router.get("/comments/pending")
+@router.get("/comments/pending", response_model=PendingCommentListResponse)
 async def list_pending_comments(
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     _: bool = Depends(verify_admin_token),
     session: AsyncSession = Depends(get_db_session),
-) -> dict[str, Any]:
-    """List comments pending approval."""
+) -> PendingCommentListResponse:
+    """List comments pending approval, optionally paginated."""
+    pending = Comment.is_approved == False
     result = await session.execute(
-        select(Comment)
-        .where(Comment.is_approved == False)
+        select(Comment, func.count().over().label("total"))
+        .where(pending)
         .order_by(Comment.created_at.desc())
+        .offset(offset)
+        .limit(limit)
+    )
+    rows = result.all()
+
+    return PendingCommentListResponse(
+        comments=[PendingCommentResponse.model_validate(row.Comment) for row in rows],
+        total=await _page_total(session, rows, offset, Comment, pending),
     )
-    comments = list(result.scalars().all())
-
-    return {
-        "comments": [
-            {
-                "id": c.id,
-                "vote_id": c.vote_id,
-                "content": c.content,
-                "created_at": c.created_at.isoformat(),
-            }
-            for c in comments
-        ],
-        "total": len(comments),
-    }
 
 
 @router.put("/comments/{comment_id}/approve")
@@ -149,19 +178,21 @@ async def approve_comment(
     session: AsyncSession = Depends(get_db_session),
 ) -> dict[str, Any]:
     """Approve or reject a comment."""
-    result = await session.execute(
-        select(Comment).where(Comment.id == comment_id)
-    )
-    comment = result.scalar_one_or_none()
+    if approve:
+        stmt = (
+            update(Comment)
+            .where(Comment.id == comment_id)
+            .values(is_approved=True)
+            .returning(Comment.id)
+        )
+    else:
+        stmt = delete(Comment).where(Comment.id == comment_id).returning(Comment.id)
 
-    if not comment:
+    result = await session.execute(stmt)
+    if result.first() is None:
         raise HTTPException(status_code=404, detail="Comment not found")
 
+    await session.commit()
     if approve:
-        comment.is_approved = True
-        await session.commit()
         return {"success": True, "message": "Comment approved"}
-    else:
-        await session.delete(comment)
-        await session.commit()
-        return {"success": True, "message": "Comment rejected and deleted"}
+    return {"success": True, "message": "Comment rejected and deleted"}
@@ -1,37 +1,86 @@
 """Category listing and detail endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Load, joinedload, raiseload, selectinload
 
-from vote_api.connections import get_db_session
+from vote_api.connections import get_db_session, get_redis_cache
 from vote_api.models.database import Category, CategoryItem, Item
 from vote_api.models.schemas import CategoryListResponse, CategoryResponse, ItemResponse
+from vote_api.services.category_cache import CategoryCache
 
 router = APIRouter(prefix="/api/v1/categories", tags=["categories"])
 
+_item_list_adapter = TypeAdapter(list[ItemResponse])
+
+
+def _json_response(body: str) -> Response:
+    return Response(content=body, media_type="application/json")
+
+
+def _category_items_loader() -> Load:
+    """Eager-load category items with their item and group.
+
+    Any other relationship access raises instead of lazy loading, so an N+1
+    can't creep back in unnoticed.
+    """
+    return selectinload(Category.category_items).options(
+        selectinload(CategoryItem.item).options(
+            joinedload(Item.group), raiseload("*")
+        ),
+        raiseload("*"),
+    )
+
 
 @router.get("", response_model=CategoryListResponse)
 async def list_categories(
     active_only: bool = True,
     include_items: bool = False,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    offset: int = Query(0, ge=0),
     session: AsyncSession = Depends(get_db_session),
-) -> CategoryListResponse:
-    """List all voting categories."""
-    query = select(Category).where(Category.is_soft_deleted == False)
+) -> Response:
+    """List voting categories, optionally paginated with `limit`/`offset`."""
+    # Only first pages are cached; deeper offsets are unbounded and would
+    # let clients mint arbitrarily many cache keys.
+    cache = CategoryCache(get_redis_cache())
+    cache_key = (
+        CategoryCache.list_key(active_only, include_items, limit, offset)
+        if offset == 0
+        else None
+    )
+    if cache_key is not None:
+        cached = await cache.get(cache_key)
+        if cached is not None:
+            return _json_response(cached)
+
+    filters = [Category.is_soft_deleted == False]
     if active_only:
-        query = query.where(Category.is_active == True)
+        filters.append(Category.is_active == True)
+
+    # The window count yields the unpaginated total alongside the page.
+    query = select(Category, func.count().over().label("total")).where(*filters)
     if include_items:
-        query = query.options(
-            selectinload(Category.category_items)
-            .selectinload(CategoryItem.item)
-            .selectinload(Item.group)
-        )
-    query = query.order_by(Category.created_at.desc())
+        query = query.options(_category_items_loader())
+    query = query.options(raiseload("*"))
+    query = query.order_by(Category.created_at.desc()).offset(offset).limit(limit)
 
     result = await session.execute(query)
-    categories = list(result.scalars().all())
+    rows = result.all()
+    categories = [row.Category for row in rows]
+    if rows:
+        total = rows[0].total
+    elif offset:
+        # Past the last page there's no row to carry the window count
+        total = await session.scalar(
+            select(func.count()).select_from(Category).where(*filters)
+        )
+    else:
+        total = 0
 
     # Build response, optionally including category items.
     category_responses = [
@@ -68,22 +117,29 @@ async def list_categories(
         for cat in categories
     ]
 
-    return CategoryListResponse(categories=category_responses, total=len(categories))
+    body = CategoryListResponse(
+        categories=category_responses, total=total
+    ).model_dump_json()
+    if cache_key is not None:
+        await cache.set(cache_key, body)
+    return _json_response(body)
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
 async def get_category(
     category_id: int,
     session: AsyncSession = Depends(get_db_session),
-) -> CategoryResponse:
+) -> Response:
     """Get a category with its items."""
+    cache = CategoryCache(get_redis_cache())
+    cache_key = CategoryCache.detail_key(category_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
     result = await session.execute(
         select(Category)
-        .options(
-            selectinload(Category.category_items)
-            .selectinload(CategoryItem.item)
-            .selectinload(Item.group)
-        )
+        .options(_category_items_loader(), raiseload("*"))
         .where(Category.id == category_id, Category.is_soft_deleted == False)
     )
     category = result.scalar_one_or_none()
@@ -101,12 +157,14 @@ async def get_category(
                 id=item.id,
                 name=item.name,
                 image_url=item.image_url,
-                group_name=None if is_survey else (item.group.name if item.group else None),
+                group_name=(
+                    None if is_survey else (item.group.name if item.group else None)
+                ),
                 metadata=item.metadata_,
             )
         )
 
-    return CategoryResponse(
+    body = CategoryResponse(
         id=category.id,
         name=category.name,
         description=category.description,
@@ -114,41 +172,55 @@ async def get_category(
         is_active=category.is_active,
         settings=category.settings or {},
         items=items,
-    )
+    ).model_dump_json()
+    await cache.set(cache_key, body)
+    return _json_response(body)
 
 
 @router.get("/{category_id}/items", response_model=list[ItemResponse])
 async def get_category_items(
     category_id: int,
     session: AsyncSession = Depends(get_db_session),
-) -> list[ItemResponse]:
+) -> Response:
     """Get items for a specific category."""
+    cache = CategoryCache(get_redis_cache())
+    cache_key = CategoryCache.items_key(category_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return _json_response(cached)
+
     category_result = await session.execute(
-        select(Category).where(
+        select(Category.settings).where(
             Category.id == category_id,
             Category.is_soft_deleted == False,
         )
     )
-    category = category_result.scalar_one_or_none()
-    if not category:
+    category_row = category_result.one_or_none()
+    if category_row is None:
         raise HTTPException(status_code=404, detail="Category not found")
-    is_survey = bool((category.settings or {}).get("survey_key"))
+    is_survey = bool((category_row.settings or {}).get("survey_key"))
 
     result = await session.execute(
         select(Item)
         .join(CategoryItem)
-        .options(selectinload(Item.group))
+        .options(joinedload(Item.group), raiseload("*"))
         .where(CategoryItem.category_id == category_id)
     )
     items = list(result.scalars().all())
 
-    return [
-        ItemResponse(
-            id=item.id,
-            name=item.name,
-            image_url=item.image_url,
-            group_name=None if is_survey else (item.group.name if item.group else None),
-            metadata=item.metadata_,
-        )
-        for item in items
-    ]
+    body = _item_list_adapter.dump_json(
+        [
+            ItemResponse(
+                id=item.id,
+                name=item.name,
+                image_url=item.image_url,
+                group_name=(
+                    None if is_survey else (item.group.name if item.group else None)
+                ),
+                metadata=item.metadata_,
+            )
+            for item in items
+        ]
+    ).decode()
+    await cache.set(cache_key, body)
+    return _json_response(body)
@@ -1,13 +1,18 @@
 """Health check endpoints."""
 
+import asyncio
+import os
+
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import text
 
-from vote_api.connections import async_session_factory, get_redis
+from vote_api.connections import async_session_factory, get_redis_cache
 from vote_api.models.schemas import HealthResponse
 
 router = APIRouter(tags=["health"])
 
+READY_PROBE_TIMEOUT = float(os.getenv("READY_PROBE_TIMEOUT", "1.0"))
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
@@ -15,24 +20,31 @@ async def health_check() -> HealthResponse:
     return HealthResponse(status="healthy", version="1.0.0")
 
 
+async def _check_db() -> None:
+    async with async_session_factory() as session:
+        await session.execute(text("SELECT 1"))
+
+
+async def _check_redis() -> None:
+    await get_redis_cache().ping()
+
+
 @router.get("/ready", response_model=HealthResponse)
 async def readiness_check() -> HealthResponse:
     """Readiness check endpoint for Kubernetes probes."""
-    errors = []
+    # Probe both dependencies concurrently, each bounded by a timeout
+    results = await asyncio.gather(
+        asyncio.wait_for(_check_db(), READY_PROBE_TIMEOUT),
+        asyncio.wait_for(_check_redis(), READY_PROBE_TIMEOUT),
+        return_exceptions=True,
+    )
 
-    # Check database connectivity
-    try:
-        async with async_session_factory() as session:
-            await session.execute(text("SELECT 1"))
-    except Exception as e:
-        errors.append(f"Database: {str(e)}")
-
-    # Check Redis connectivity
-    try:
-        redis_client = get_redis()
-        redis_client.ping()
-    except Exception as e:
-        errors.append(f"Redis: {str(e)}")
+    errors = []
+    for name, result in zip(("Database", "Redis"), results):
+        if isinstance(result, asyncio.TimeoutError):
+            errors.append(f"{name}: timed out after {READY_PROBE_TIMEOUT}s")
+        elif isinstance(result, Exception):
+            errors.append(f"{name}: {str(result)}")
 
     if errors:
         raise HTTPException(status_code=503, detail="; ".join(errors))
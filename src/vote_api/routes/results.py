@@ -1,29 +1,35 @@
 """Results and statistics endpoints."""
 
-from collections import defaultdict
+import asyncio
+from typing import NamedTuple, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import func, select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import Float, cast, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from vote_api.connections import get_db_session
+from vote_api.connections import (
+    async_session_factory,
+    get_db_session,
+    get_redis_cache,
+)
 from vote_api.models.database import (
     Category,
     CategoryItem,
     EloRating,
     Item,
     Vote,
-    VoteChoice,
 )
 from vote_api.models.enums import ComparisonMode
 from vote_api.models.schemas import ItemResultResponse, ResultsResponse
+from vote_api.services.category_cache import CategoryCache
 from vote_api.services.fingerprint import get_vote_identity, validate_fingerprint
+from vote_api.services.results_cache import ResultsCache
 from vote_api.services.statistics import (
-    calculate_average_rank,
     calculate_percentage,
-    wilson_confidence_interval,
+    wilson_confidence_intervals,
 )
+from vote_api.services.tally import TallyService
 
 router = APIRouter(prefix="/api/v1/results", tags=["results"])
 
@@ -34,21 +40,27 @@ async def get_results(
     request: Request,
     fingerprint: str | None = None,
     session: AsyncSession = Depends(get_db_session),
-) -> ResultsResponse:
+) -> Response:
     """Get voting results for a category with statistics."""
-    # Get category with items
+    # Only public results are ever cached, so a hit needs no access check
+    results_cache = ResultsCache(get_redis_cache())
+    generation, cached = await results_cache.get(category_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
     result = await session.execute(
-        select(Category)
-        .options(selectinload(Category.category_items).selectinload(CategoryItem.item))
-        .where(Category.id == category_id, Category.is_soft_deleted == False)
+        select(
+            Category.id, Category.name, Category.comparison_mode, Category.settings
+        ).where(Category.id == category_id, Category.is_soft_deleted == False)
     )
-    category = result.scalar_one_or_none()
+    category = result.first()
 
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
 
     settings = category.settings or {}
-    if settings.get("private_results"):
+    is_private = bool(settings.get("private_results"))
+    if is_private:
         if not fingerprint or not validate_fingerprint(fingerprint):
             raise HTTPException(
                 status_code=403,
@@ -56,27 +68,24 @@ async def get_results(
             )
         fingerprint_hash, _ = get_vote_identity(request, fingerprint)
         vote_result = await session.execute(
-            select(Vote.id).where(
+            select(literal(1))
+            .where(
                 Vote.category_id == category_id,
                 Vote.fingerprint_hash == fingerprint_hash,
             )
+            .limit(1)
         )
-        if not vote_result.scalar_one_or_none():
+        if vote_result.scalar_one_or_none() is None:
             raise HTTPException(
                 status_code=403,
                 detail="Results are private until you vote",
             )
 
-    # Get total vote count
-    total_result = await session.execute(
-        select(func.count(Vote.id)).where(Vote.category_id == category_id)
+    # The total and the roster are independent; fetch them concurrently
+    total_votes, items_by_id = await asyncio.gather(
+        _count_votes(category_id),
+        _load_category_items(session, category_id),
     )
-    total_votes = total_result.scalar() or 0
-
-    # Build item lookup
-    items_by_id = {
-        cat_item.item.id: cat_item.item for cat_item in category.category_items
-    }
 
     # Calculate results based on comparison mode
     if category.comparison_mode in (
@@ -99,39 +108,95 @@ async def get_results(
     else:
         results = []
 
-    return ResultsResponse(
+    # Every field below is already typed by the query or calculator, so the
+    # response models are built without re-validation
+    body = ResultsResponse.model_construct(
         category_id=category.id,
         category_name=category.name,
-        comparison_mode=category.comparison_mode,
+        comparison_mode=ComparisonMode(category.comparison_mode),
         total_votes=total_votes,
         results=results,
-    )
+    ).model_dump_json()
+    if generation is not None and not is_private:
+        await results_cache.set(category_id, generation, body)
+    return Response(content=body, media_type="application/json")
+
+
+async def _count_votes(category_id: int) -> int:
+    """Count a category's votes on a session of its own.
+
+    An AsyncSession can't run two statements at once, so this gets a
+    separate pooled connection to overlap with the request session's work.
+    count(*) rather than count(id) lets Postgres answer from
+    idx_votes_category alone (index-only scan).
+    """
+    async with async_session_factory() as session:
+        result = await session.execute(
+            select(func.count())
+            .select_from(Vote)
+            .where(Vote.category_id == category_id)
+        )
+        return result.scalar() or 0
+
+
+class _ItemInfo(NamedTuple):
+    """The item fields results need; mirrors the `Item` attribute names."""
+
+    name: str
+    image_url: Optional[str]
+    metadata_: dict
+
+
+async def _load_category_items(
+    session: AsyncSession, category_id: int
+) -> dict[int, _ItemInfo]:
+    """Return {item_id: _ItemInfo} for a category's roster.
+
+    The roster rarely changes while a poll is open, so it is cached alongside
+    the other category responses and dropped by the same invalidation.
+    """
+    cache = CategoryCache(get_redis_cache())
+    cache_key = CategoryCache.roster_key(category_id)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        rows = orjson.loads(cached)
+    else:
+        result = await session.execute(
+            select(Item.id, Item.name, Item.image_url, Item.metadata_)
+            .join(CategoryItem, CategoryItem.item_id == Item.id)
+            .where(CategoryItem.category_id == category_id)
+        )
+        rows = [tuple(row) for row in result.all()]
+        await cache.set(cache_key, orjson.dumps(rows).decode())
+
+    return {
+        item_id: _ItemInfo(name, image_url, metadata or {})
+        for item_id, name, image_url, metadata in rows
+    }
 
 
 async def _calculate_single_choice_results(
     session: AsyncSession,
     category_id: int,
-    items_by_id: dict[int, Item],
+    items_by_id: dict[int, _ItemInfo],
     total_votes: int,
 ) -> list[ItemResultResponse]:
     """Calculate results for single choice voting."""
-    # Count votes per item
-    vote_counts = await session.execute(
-        select(VoteChoice.item_id, func.count(VoteChoice.id))
-        .join(Vote)
-        .where(Vote.category_id == category_id)
-        .group_by(VoteChoice.item_id)
-    )
-    counts = {row[0]: row[1] for row in vote_counts.all()}
+    # Vote counts per item, most votes first
+    summary = await TallyService(session).get_summary(category_id)
+    # The roster may be served from cache; skip rows it doesn't know yet
+    rows = [row for row in summary if row[0] in items_by_id]
+    intervals = wilson_confidence_intervals([row[1] for row in rows], total_votes)
 
     results = []
-    for item_id, item in items_by_id.items():
-        vote_count = counts.get(item_id, 0)
+    for (item_id, vote_count, _, _), (wilson_lower, wilson_upper) in zip(
+        rows, intervals
+    ):
+        item = items_by_id[item_id]
         percentage = calculate_percentage(vote_count, total_votes)
-        wilson_lower, wilson_upper = wilson_confidence_interval(vote_count, total_votes)
 
         results.append(
-            ItemResultResponse(
+            ItemResultResponse.model_construct(
                 item_id=item_id,
                 item_name=item.name,
                 image_url=item.image_url,
@@ -142,89 +207,89 @@ async def _calculate_single_choice_results(
             )
         )
 
-    # Sort by percentage descending
-    results.sort(key=lambda x: x.percentage, reverse=True)
     return results
 
 
 async def _calculate_elo_results(
     session: AsyncSession,
     category_id: int,
-    items_by_id: dict[int, Item],
+    items_by_id: dict[int, _ItemInfo],
 ) -> list[ItemResultResponse]:
     """Calculate results for ELO tournament voting."""
-    # Get ELO ratings
+    # Ratings best-first, with each item's share of all games played
+    share = func.coalesce(
+        EloRating.games_played * 100.0
+        / func.nullif(func.sum(EloRating.games_played).over(), 0),
+        0,
+    )
     ratings_result = await session.execute(
-        select(EloRating).where(EloRating.category_id == category_id)
+        select(
+            EloRating.item_id,
+            EloRating.rating,
+            EloRating.games_played,
+            cast(share, Float).label("percentage"),
+        )
+        .where(EloRating.category_id == category_id)
+        .order_by(EloRating.rating.desc(), EloRating.item_id)
     )
-    ratings = {r.item_id: r for r in ratings_result.scalars().all()}
-
-    # Count total games for percentage calculation
-    total_games = sum(r.games_played for r in ratings.values()) // 2  # Each game has 2 players
-
-    results = []
-    for item_id, item in items_by_id.items():
-        rating = ratings.get(item_id)
-        games_played = rating.games_played if rating else 0
-        elo_rating = rating.rating if rating else 1500.0
 
-        # Calculate win percentage from games
-        wins = 0
-        if rating and games_played > 0:
-            # Estimate wins from ELO change
-            # This is approximate; for exact wins, we'd need to track them
-            wins = max(0, int((elo_rating - 1500) / 32 + games_played / 2))
-
-        percentage = calculate_percentage(games_played, total_games * 2) if total_games else 0
-
-        results.append(
-            ItemResultResponse(
-                item_id=item_id,
-                item_name=item.name,
-                image_url=item.image_url,
-                vote_count=games_played,
-                percentage=round(percentage, 2),
-                elo_rating=round(elo_rating, 2),
-                games_played=games_played,
-            )
+    def to_response(
+        item_id: int, rating: float, games_played: int, percentage: float
+    ) -> ItemResultResponse:
+        item = items_by_id[item_id]
+        return ItemResultResponse.model_construct(
+            item_id=item_id,
+            item_name=item.name,
+            image_url=item.image_url,
+            vote_count=games_played,
+            percentage=round(percentage, 2),
+            elo_rating=round(rating, 2),
+            games_played=games_played,
         )
 
-    # Sort by ELO rating descending
-    results.sort(key=lambda x: x.elo_rating or 0, reverse=True)
-    return results
+    # Unrated roster items sit at the initial 1500 rating, so they slot in
+    # between the rated items above and below it.
+    above, below = [], []
+    rated: set[int] = set()
+    for item_id, rating, games_played, percentage in ratings_result.all():
+        if item_id not in items_by_id:
+            continue
+        rated.add(item_id)
+        target = above if rating >= 1500.0 else below
+        target.append(to_response(item_id, rating, games_played, percentage))
+
+    unrated = [
+        to_response(item_id, 1500.0, 0, 0.0)
+        for item_id in items_by_id
+        if item_id not in rated
+    ]
+    return above + unrated + below
 
 
 async def _calculate_ranked_results(
     session: AsyncSession,
     category_id: int,
-    items_by_id: dict[int, Item],
+    items_by_id: dict[int, _ItemInfo],
     total_votes: int,
 ) -> list[ItemResultResponse]:
     """Calculate results for ranked list voting."""
-    # Get all rankings
-    rankings_result = await session.execute(
-        select(VoteChoice.item_id, VoteChoice.rank)
-        .join(Vote)
-        .where(Vote.category_id == category_id, VoteChoice.rank.isnot(None))
+    # Rank totals per item, best average rank first
+    summary = await TallyService(session).get_summary(
+        category_id, by_average_rank=True
     )
 
-    # Group rankings by item
-    item_rankings: dict[int, list[int]] = defaultdict(list)
-    for item_id, rank in rankings_result.all():
-        item_rankings[item_id].append(rank)
-
     results = []
-    for item_id, item in items_by_id.items():
-        ranks = item_rankings.get(item_id, [])
-        vote_count = len(ranks)
-        average_rank = calculate_average_rank(ranks)
+    for item_id, vote_count, rank_sum, first_place_count in summary:
+        item = items_by_id.get(item_id)
+        if item is None:
+            continue
+        average_rank = round(rank_sum / vote_count, 2) if vote_count else None
 
         # For percentage, use how often item was ranked 1st
-        first_place_count = sum(1 for r in ranks if r == 1)
         percentage = calculate_percentage(first_place_count, total_votes)
 
         results.append(
-            ItemResultResponse(
+            ItemResultResponse.model_construct(
                 item_id=item_id,
                 item_name=item.name,
                 image_url=item.image_url,
@@ -234,42 +299,32 @@ async def _calculate_ranked_results(
             )
         )
 
-    # Sort by average rank ascending (lower is better)
-    results.sort(key=lambda x: x.average_rank or float("inf"))
     return results
 
 
 async def _calculate_tournament_tiers_results(
     session: AsyncSession,
     category_id: int,
-    items_by_id: dict[int, Item],
+    items_by_id: dict[int, _ItemInfo],
     total_votes: int,
     settings: dict,
 ) -> list[ItemResultResponse]:
     """Calculate results for tournament tier voting."""
     tier_options = settings.get("tier_options", ["X", "S+", "S", "A", "B", "C", "D"])
 
-    # Get all tier votes (rank field stores tier index)
-    tier_votes_result = await session.execute(
-        select(VoteChoice.item_id, VoteChoice.rank)
-        .join(Vote)
-        .where(Vote.category_id == category_id, VoteChoice.rank.isnot(None))
+    # Tier histogram per item (rank field stores tier index), ordered by
+    # average tier ignoring "Don't know" votes (last tier)
+    tallies = await TallyService(session).get_counts(
+        category_id, average_below=len(tier_options) - 1
     )
-
-    # Group tier votes by item
-    item_tiers: dict[int, list[int]] = defaultdict(list)
-    for item_id, tier_index in tier_votes_result.all():
-        item_tiers[item_id].append(tier_index)
+    ordered_ids = [item_id for item_id in tallies if item_id in items_by_id]
+    ordered_ids.extend(item_id for item_id in items_by_id if item_id not in tallies)
 
     results = []
-    for item_id, item in items_by_id.items():
-        tiers = item_tiers.get(item_id, [])
-        vote_count = len(tiers)
-
-        # Calculate tier distribution
-        tier_counts = defaultdict(int)
-        for tier_idx in tiers:
-            tier_counts[tier_idx] += 1
+    for item_id in ordered_ids:
+        item = items_by_id[item_id]
+        tier_counts = tallies.get(item_id, {})
+        vote_count = sum(tier_counts.values())
 
         # Build tier distribution dict with tier names
         tier_distribution = {}
@@ -278,17 +333,20 @@ async def _calculate_tournament_tiers_results(
 
         # Calculate average tier (lower index = higher tier)
         average_tier = None
-        if tiers:
-            # Filter out "Don't know" votes (last tier) for average
-            known_tiers = [t for t in tiers if t < len(tier_options) - 1]
-            if known_tiers:
-                average_tier = round(sum(known_tiers) / len(known_tiers), 2)
+        # Filter out "Don't know" votes (last tier) for average
+        known_tiers = {
+            t: count for t, count in tier_counts.items() if t < len(tier_options) - 1
+        }
+        known_count = sum(known_tiers.values())
+        if known_count:
+            tier_sum = sum(t * count for t, count in known_tiers.items())
+            average_tier = round(tier_sum / known_count, 2)
 
         # Get item metadata for display name
         metadata = item.metadata_ or {}
 
         results.append(
-            ItemResultResponse(
+            ItemResultResponse.model_construct(
                 item_id=item_id,
                 item_name=metadata.get("display_name", item.name),
                 image_url=item.image_url,
@@ -299,6 +357,4 @@ async def _calculate_tournament_tiers_results(
             )
         )
 
-    # Sort by average tier ascending (lower = better tier)
-    results.sort(key=lambda x: x.average_rank if x.average_rank is not None else float("inf"))
     return results
@@ -1,13 +1,17 @@
 """Vote submission endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy import select
+from functools import lru_cache
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request
+from sqlalchemy import Integer, bindparam, func, insert, literal_column, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
-from vote_api.connections import get_db_session, get_redis
+from vote_api.connections import get_db_session, get_redis_cache
 from vote_api.models.database import (
     Category,
-    CategoryItem,
     Comment,
     Vote,
     VoteChoice,
@@ -19,6 +23,7 @@ from vote_api.models.schemas import (
     VoteResponse,
     VoteStatusResponse,
 )
+from vote_api.services.category_cache import CategoryCache
 from vote_api.services.discord_auth import get_discord_identity
 from vote_api.services.elo import EloService
 from vote_api.services.fingerprint import (
@@ -26,13 +31,31 @@ from vote_api.services.fingerprint import (
     get_vote_identity,
     validate_fingerprint,
 )
+from vote_api.services.results_cache import ResultsCache
+from vote_api.services.tally import TallyService
 
 router = APIRouter(prefix="/api/v1", tags=["votes"])
 
 
-def _enforce_discord_vote_auth(category: Category, request: Request) -> None:
+# Category fields the vote endpoints read; selected as columns so the
+# hot path skips ORM hydration.
+_VOTE_CATEGORY_COLUMNS = (
+    Category.id,
+    Category.is_active,
+    Category.comparison_mode,
+    Category.settings,
+)
+
+
+@lru_cache(maxsize=1)
+def get_anti_manipulation() -> AntiManipulationService:
+    """Shared anti-manipulation checker; its thresholds are read from env once."""
+    return AntiManipulationService(get_redis_cache())
+
+
+def _enforce_discord_vote_auth(settings: dict | None, request: Request) -> None:
     """Require Discord auth when category settings mark it as required."""
-    settings = category.settings or {}
+    settings = settings or {}
     if not settings.get("discord_required"):
         return
 
@@ -52,7 +75,9 @@ def _enforce_discord_vote_auth(category: Category, request: Request) -> None:
 async def submit_vote(
     request: Request,
     vote_request: VoteRequest,
+    background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_db_session),
+    anti_manipulation: AntiManipulationService = Depends(get_anti_manipulation),
 ) -> VoteResponse:
     """Submit a vote for a category."""
     # Validate fingerprint format
@@ -63,9 +88,7 @@ async def submit_vote(
     fingerprint_hash, ip_hash = get_vote_identity(request, vote_request.fingerprint)
 
     # Check for manipulation
-    redis_client = get_redis()
-    anti_manipulation = AntiManipulationService(redis_client)
-    is_suspicious, reason = anti_manipulation.check_suspicious_patterns(
+    is_suspicious, reason = await anti_manipulation.check_suspicious_patterns(
         ip_hash, fingerprint_hash
     )
     if is_suspicious:
@@ -73,35 +96,22 @@ async def submit_vote(
 
     # Get category
     result = await session.execute(
-        select(Category).where(
+        select(*_VOTE_CATEGORY_COLUMNS).where(
             Category.id == vote_request.category_id,
             Category.is_soft_deleted == False,
         )
     )
-    category = result.scalar_one_or_none()
+    category = result.first()
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     if not category.is_active:
         raise HTTPException(status_code=400, detail="Category is not active")
-    _enforce_discord_vote_auth(category, request)
-
-    # Check if user already voted
-    existing_vote = await session.execute(
-        select(Vote).where(
-            Vote.category_id == vote_request.category_id,
-            Vote.fingerprint_hash == fingerprint_hash,
-        )
-    )
-    if existing_vote.scalar_one_or_none():
-        raise HTTPException(status_code=409, detail="Already voted in this category")
+    _enforce_discord_vote_auth(category.settings, request)
 
     # Validate that all choices are valid items for this category
-    valid_items = await session.execute(
-        select(CategoryItem.item_id).where(
-            CategoryItem.category_id == vote_request.category_id
-        )
+    valid_item_ids = await CategoryCache(get_redis_cache()).get_item_ids(
+        session, vote_request.category_id
     )
-    valid_item_ids = {row[0] for row in valid_items.all()}
 
     # For tournament_tiers, only every other value is an item ID
     if category.comparison_mode == ComparisonMode.TOURNAMENT_TIERS.value:
@@ -109,12 +119,15 @@ async def submit_vote(
     else:
         item_ids_to_check = vote_request.choices
 
-    for item_id in item_ids_to_check:
-        if item_id not in valid_item_ids:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Item {item_id} is not valid for this category",
-            )
+    chosen_item_ids = set(item_ids_to_check)
+    invalid_item_ids = chosen_item_ids - valid_item_ids
+    if invalid_item_ids:
+        if len(invalid_item_ids) == 1:
+            detail = f"Item {invalid_item_ids.pop()} is not valid for this category"
+        else:
+            ids = ", ".join(str(i) for i in sorted(invalid_item_ids))
+            detail = f"Items {ids} are not valid for this category"
+        raise HTTPException(status_code=400, detail=detail)
 
     # Validate choice count based on comparison mode
     if category.comparison_mode == ComparisonMode.SINGLE_CHOICE.value:
@@ -129,11 +142,6 @@ async def submit_vote(
                 status_code=400,
                 detail="Multi-select mode requires at least one choice",
             )
-        if len(set(vote_request.choices)) != len(vote_request.choices):
-            raise HTTPException(
-                status_code=400,
-                detail="Duplicate choices are not allowed",
-            )
         max_choices = category.settings.get("max_choices")
         if isinstance(max_choices, int) and max_choices > 0:
             if len(vote_request.choices) > max_choices:
@@ -173,43 +181,77 @@ async def submit_vote(
         # Validate tier indices
         tier_options = category.settings.get("tier_options", [])
         num_tiers = len(tier_options) if tier_options else 7
-        for i in range(1, len(vote_request.choices), 2):
-            tier_idx = vote_request.choices[i]
-            if tier_idx < 0 or tier_idx >= num_tiers:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid tier index: {tier_idx}",
-                )
+        tier_indices = vote_request.choices[1::2]
+        if min(tier_indices) < 0 or max(tier_indices) >= num_tiers:
+            tier_idx = next(t for t in tier_indices if t < 0 or t >= num_tiers)
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid tier index: {tier_idx}",
+            )
 
-    # Create vote
-    vote = Vote(
-        category_id=vote_request.category_id,
-        fingerprint_hash=fingerprint_hash,
-        ip_hash=ip_hash,
-    )
-    session.add(vote)
-    await session.flush()
+    # An item may appear once per vote (uq_choice_per_vote), in every mode
+    if len(chosen_item_ids) != len(item_ids_to_check):
+        raise HTTPException(
+            status_code=400,
+            detail="Duplicate choices are not allowed",
+        )
 
-    # Create vote choices
+    # Pair each choice with its rank
     if category.comparison_mode == ComparisonMode.TOURNAMENT_TIERS.value:
         # Handle pairs: [item_id, tier_index, item_id, tier_index, ...]
-        for i in range(0, len(vote_request.choices), 2):
-            item_id = vote_request.choices[i]
-            tier_index = vote_request.choices[i + 1]
-            choice = VoteChoice(
-                vote_id=vote.id,
-                item_id=item_id,
-                rank=tier_index,  # Store tier index in rank field
-            )
-            session.add(choice)
+        # (tier index is stored in the rank field)
+        choice_pairs = list(zip(vote_request.choices[::2], vote_request.choices[1::2]))
+    elif category.comparison_mode == ComparisonMode.RANKED_LIST.value:
+        choice_pairs = [
+            (item_id, rank) for rank, item_id in enumerate(vote_request.choices, 1)
+        ]
     else:
-        for rank, item_id in enumerate(vote_request.choices):
-            choice = VoteChoice(
-                vote_id=vote.id,
-                item_id=item_id,
-                rank=rank + 1 if category.comparison_mode == ComparisonMode.RANKED_LIST.value else None,
-            )
-            session.add(choice)
+        choice_pairs = [(item_id, None) for item_id in vote_request.choices]
+
+    # Create the vote and its choices in one statement. uq_vote_per_fingerprint
+    # rejects a repeat (or concurrent) vote from the same fingerprint, in which
+    # case the CTE inserts nothing and no id comes back.
+    new_vote = (
+        pg_insert(Vote)
+        .values(
+            category_id=vote_request.category_id,
+            fingerprint_hash=fingerprint_hash,
+            ip_hash=ip_hash,
+        )
+        .on_conflict_do_nothing(constraint="uq_vote_per_fingerprint")
+        .returning(Vote.id)
+        .cte("new_vote")
+    )
+    # render_derived() spells out AS anon(item_id, rank); a multi-array unnest
+    # otherwise names every output column "unnest"
+    choice_rows = (
+        func.unnest(
+            bindparam(
+                "item_ids",
+                [item_id for item_id, _ in choice_pairs],
+                type_=ARRAY(Integer),
+            ),
+            bindparam(
+                "ranks", [rank for _, rank in choice_pairs], type_=ARRAY(Integer)
+            ),
+        )
+        .table_valued("item_id", "rank")
+        .render_derived()
+    )
+    new_choices = (
+        insert(VoteChoice)
+        .from_select(
+            ["vote_id", "item_id", "rank"],
+            select(new_vote.c.id, choice_rows.c.item_id, choice_rows.c.rank),
+        )
+        .cte("new_choices")
+    )
+    vote_result = await session.execute(select(new_vote.c.id).add_cte(new_choices))
+    vote_id = vote_result.scalar_one_or_none()
+    if vote_id is None:
+        raise HTTPException(status_code=409, detail="Already voted in this category")
+
+    await TallyService(session).apply(category.id, choice_pairs)
 
     # Handle ELO updates for tournament mode
     if category.comparison_mode == ComparisonMode.ELO_TOURNAMENT.value:
@@ -220,22 +262,27 @@ async def submit_vote(
     # Add comment if provided
     if vote_request.comment:
         comment = Comment(
-            vote_id=vote.id,
+            vote_id=vote_id,
             content=vote_request.comment,
             is_approved=False,
         )
         session.add(comment)
 
     await session.commit()
-
-    # Record attempt
-    anti_manipulation.record_vote_attempt(
-        ip_hash, fingerprint_hash, vote_request.category_id, success=True
+    await ResultsCache(get_redis_cache()).bump(vote_request.category_id)
+
+    # Record attempt after the response is sent; it's only for analysis
+    background_tasks.add_task(
+        anti_manipulation.record_vote_attempt,
+        ip_hash,
+        fingerprint_hash,
+        vote_request.category_id,
+        success=True,
     )
 
     return VoteResponse(
         success=True,
-        vote_id=vote.id,
+        vote_id=vote_id,
         message="Vote recorded successfully",
     )
 
@@ -263,12 +310,12 @@ async def get_vote_status(
     fingerprint_hash, _ = get_vote_identity(request, fingerprint)
 
     result = await session.execute(
-        select(Vote).where(
+        select(Vote.id, Vote.created_at).where(
             Vote.category_id == category_id,
             Vote.fingerprint_hash == fingerprint_hash,
         )
     )
-    vote = result.scalar_one_or_none()
+    vote = result.first()
 
     if vote:
         return VoteStatusResponse(
@@ -349,6 +396,7 @@ async def upsert_vote(
     request: Request,
     vote_request: VoteRequest,
     session: AsyncSession = Depends(get_db_session),
+    anti_manipulation: AntiManipulationService = Depends(get_anti_manipulation),
 ) -> VoteResponse:
     """Upsert a single vote choice for tournament_tiers mode.
 
@@ -364,17 +412,17 @@ async def upsert_vote(
 
     # Get category
     result = await session.execute(
-        select(Category).where(
+        select(*_VOTE_CATEGORY_COLUMNS).where(
             Category.id == vote_request.category_id,
             Category.is_soft_deleted == False,
         )
     )
-    category = result.scalar_one_or_none()
+    category = result.first()
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     if not category.is_active:
         raise HTTPException(status_code=400, detail="Category is not active")
-    _enforce_discord_vote_auth(category, request)
+    _enforce_discord_vote_auth(category.settings, request)
 
     # Only allow upsert for tournament_tiers mode
     if category.comparison_mode != ComparisonMode.TOURNAMENT_TIERS.value:
@@ -393,12 +441,9 @@ async def upsert_vote(
     item_id, tier_index = vote_request.choices[0], vote_request.choices[1]
 
     # Validate item belongs to category
-    valid_items = await session.execute(
-        select(CategoryItem.item_id).where(
-            CategoryItem.category_id == vote_request.category_id
-        )
+    valid_item_ids = await CategoryCache(get_redis_cache()).get_item_ids(
+        session, vote_request.category_id
     )
-    valid_item_ids = {row[0] for row in valid_items.all()}
     if item_id not in valid_item_ids:
         raise HTTPException(
             status_code=400,
@@ -411,57 +456,61 @@ async def upsert_vote(
     if tier_index < 0 or tier_index >= num_tiers:
         raise HTTPException(status_code=400, detail=f"Invalid tier index: {tier_index}")
 
-    # Find or create vote record
-    existing_vote = await session.execute(
-        select(Vote).where(
-            Vote.category_id == vote_request.category_id,
-            Vote.fingerprint_hash == fingerprint_hash,
-        )
+    # Find or create the vote record. The no-op DO UPDATE returns the id of
+    # an existing vote and row-locks it, serializing this voter's upserts.
+    vote_stmt = pg_insert(Vote).values(
+        category_id=vote_request.category_id,
+        fingerprint_hash=fingerprint_hash,
+        ip_hash=ip_hash,
+    )
+    vote_result = await session.execute(
+        vote_stmt.on_conflict_do_update(
+            constraint="uq_vote_per_fingerprint",
+            set_={"category_id": vote_stmt.excluded.category_id},
+        ).returning(Vote.id, literal_column("xmax = 0").label("inserted"))
     )
-    vote = existing_vote.scalar_one_or_none()
+    vote_id, created = vote_result.one()
 
-    if vote is None:
-        # Check for manipulation before creating new vote
-        redis_client = get_redis()
-        anti_manipulation = AntiManipulationService(redis_client)
-        is_suspicious, reason = anti_manipulation.check_suspicious_patterns(
+    if created:
+        # Check for manipulation before keeping a new vote; raising here
+        # leaves the insert uncommitted, so it is rolled back
+        is_suspicious, reason = await anti_manipulation.check_suspicious_patterns(
             ip_hash, fingerprint_hash
         )
         if is_suspicious:
             raise HTTPException(status_code=429, detail=f"Suspicious activity: {reason}")
 
-        vote = Vote(
-            category_id=vote_request.category_id,
-            fingerprint_hash=fingerprint_hash,
-            ip_hash=ip_hash,
-        )
-        session.add(vote)
-        await session.flush()
-
-    # Upsert vote choice
-    existing_choice = await session.execute(
-        select(VoteChoice).where(
-            VoteChoice.vote_id == vote.id,
-            VoteChoice.item_id == item_id,
+    # Upsert vote choice. The RETURNING subquery reads the statement's
+    # snapshot, so it yields the tier the choice had before this update
+    # (NULL if new); the vote row lock keeps that snapshot current.
+    previous = aliased(VoteChoice)
+    choice_stmt = pg_insert(VoteChoice).values(
+        vote_id=vote_id, item_id=item_id, rank=tier_index
+    )
+    choice_result = await session.execute(
+        choice_stmt.on_conflict_do_update(
+            constraint="uq_choice_per_vote",
+            set_={"rank": choice_stmt.excluded.rank},
+        ).returning(
+            select(previous.rank)
+            .where(previous.vote_id == vote_id, previous.item_id == item_id)
+            .scalar_subquery()
         )
     )
-    choice = existing_choice.scalar_one_or_none()
+    old_rank = choice_result.scalar_one()
 
-    if choice is None:
-        choice = VoteChoice(
-            vote_id=vote.id,
-            item_id=item_id,
-            rank=tier_index,
-        )
-        session.add(choice)
+    tally = TallyService(session)
+    if old_rank is None:
+        await tally.apply(category.id, [(item_id, tier_index)])
     else:
-        choice.rank = tier_index
+        await tally.move(category.id, item_id, old_rank, tier_index)
 
     await session.commit()
+    await ResultsCache(get_redis_cache()).bump(vote_request.category_id)
 
     return VoteResponse(
         success=True,
-        vote_id=vote.id,
+        vote_id=vote_id,
         message="Vote saved",
     )
 
@@ -474,15 +523,14 @@ async def submit_comment(
     """Submit a comment on an existing vote."""
     # Check if vote exists
     result = await session.execute(
-        select(Vote).where(Vote.id == comment_request.vote_id)
+        select(Vote.id).where(Vote.id == comment_request.vote_id)
     )
-    vote = result.scalar_one_or_none()
-    if not vote:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Vote not found")
 
     # Check if comment already exists
     existing = await session.execute(
-        select(Comment).where(Comment.vote_id == comment_request.vote_id)
+        select(Comment.id).where(Comment.vote_id == comment_request.vote_id)
     )
     if existing.scalar_one_or_none():
         raise HTTPException(status_code=409, detail="Comment already exists for this vote")
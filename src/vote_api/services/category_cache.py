@@ -0,0 +1,135 @@
+"""Cache-aside storage for category API responses."""
+
+import logging
+import os
+import time
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vote_api.models.database import CategoryItem
+
+logger = logging.getLogger(__name__)
+
+# Every cached key is also recorded here so invalidation doesn't need SCAN.
+CATEGORY_CACHE_KEYS = "vote:cache:cat:keys"
+
+# Per-process copy of each category's valid item ids, checked on every vote.
+# Kept short-lived since other workers' invalidations can't reach it.
+_ITEM_IDS_LOCAL_TTL = float(os.getenv("CATEGORY_ITEM_IDS_LOCAL_TTL", "10"))
+_local_item_ids: dict[int, tuple[float, frozenset[int]]] = {}
+
+
+class CategoryCache:
+    """Short-lived cache of serialized category responses and rosters.
+
+    Categories only change through admin updates and YAML syncs, which call
+    `invalidate()`; the TTL bounds staleness if an invalidation is missed.
+    All operations fail open when Redis is unavailable.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+        self.ttl_seconds = int(os.getenv("CATEGORY_CACHE_TTL", "60"))
+
+    @staticmethod
+    def list_key(
+        active_only: bool, include_items: bool, limit: Optional[int], offset: int
+    ) -> str:
+        return (
+            f"vote:cache:cat:list:{int(active_only)}:{int(include_items)}"
+            f":{limit or 0}:{offset}"
+        )
+
+    @staticmethod
+    def detail_key(category_id: int) -> str:
+        return f"vote:cache:cat:detail:{category_id}"
+
+    @staticmethod
+    def items_key(category_id: int) -> str:
+        return f"vote:cache:cat:items:{category_id}"
+
+    @staticmethod
+    def roster_key(category_id: int) -> str:
+        return f"vote:cache:cat:roster:{category_id}"
+
+    @staticmethod
+    def item_ids_key(category_id: int) -> str:
+        return f"vote:cache:cat:item_ids:{category_id}"
+
+    def _track(self, pipe, key: str) -> None:
+        # Each tracked entry expires within ttl_seconds, so refreshing the
+        # registry's TTL with every add lets it lapse once its members have,
+        # instead of accumulating dead keys between invalidations.
+        pipe.sadd(CATEGORY_CACHE_KEYS, key)
+        pipe.expire(CATEGORY_CACHE_KEYS, self.ttl_seconds)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Return the cached JSON body for `key`, if any."""
+        try:
+            return await self.redis.get(key)
+        except redis.RedisError:
+            return None
+
+    async def set(self, key: str, body: str) -> None:
+        """Store a JSON body under `key` and track it for invalidation."""
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.set(key, body, ex=self.ttl_seconds)
+            self._track(pipe, key)
+            await pipe.execute()
+        except redis.RedisError:
+            pass  # Non-critical, fail silently
+
+    async def get_item_ids(
+        self, session: AsyncSession, category_id: int
+    ) -> frozenset[int]:
+        """Return the ids of items that can be voted on in a category.
+
+        Checked in process memory first, then a Redis set, then the database.
+        """
+        now = time.monotonic()
+        local = _local_item_ids.get(category_id)
+        if local is not None and local[0] > now:
+            return local[1]
+
+        key = self.item_ids_key(category_id)
+        item_ids: Optional[frozenset[int]] = None
+        try:
+            members = await self.redis.smembers(key)
+            if members:
+                item_ids = frozenset(int(m) for m in members)
+        except redis.RedisError:
+            pass
+
+        if item_ids is None:
+            result = await session.execute(
+                select(CategoryItem.item_id).where(
+                    CategoryItem.category_id == category_id
+                )
+            )
+            item_ids = frozenset(result.scalars().all())
+            if item_ids:
+                try:
+                    pipe = self.redis.pipeline(transaction=False)
+                    pipe.sadd(key, *item_ids)
+                    pipe.expire(key, self.ttl_seconds)
+                    self._track(pipe, key)
+                    await pipe.execute()
+                except redis.RedisError:
+                    pass  # Non-critical, fail silently
+
+        _local_item_ids[category_id] = (now + _ITEM_IDS_LOCAL_TTL, item_ids)
+        return item_ids
+
+    async def invalidate(self) -> None:
+        """Drop every cached category response."""
+        _local_item_ids.clear()
+        try:
+            keys = await self.redis.smembers(CATEGORY_CACHE_KEYS)
+            await self.redis.unlink(CATEGORY_CACHE_KEYS, *keys)
+        except redis.RedisError as e:
+            logger.warning(f"Category cache invalidation failed: {e}")
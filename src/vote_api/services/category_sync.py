@@ -1,12 +1,13 @@
 """Git-based category synchronization service."""
 
+import asyncio
 import logging
 import os
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vote_api.models.database import (
@@ -18,11 +19,27 @@ from vote_api.models.database import (
     ItemGroup,
     Vote,
     VoteChoice,
+    VoteTally,
 )
 from vote_api.models.enums import ComparisonMode
 
 logger = logging.getLogger(__name__)
 
+# Link batches at least this large are written with COPY instead of INSERT
+_COPY_MIN_ROWS = 500
+
+# libyaml's C parser when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _parse_yaml(path: Path) -> Any:
+    return yaml.load(path.read_bytes(), Loader=_YamlLoader)
+
+
+async def _load_yaml(path: Path) -> Any:
+    """Parse a YAML file off the event loop; syncs run alongside live traffic."""
+    return await asyncio.to_thread(_parse_yaml, path)
+
 
 class CategorySyncService:
     """Service for synchronizing categories and items from YAML files."""
@@ -72,13 +89,12 @@ class CategorySyncService:
         if categories_dir.exists():
             for yaml_file in categories_dir.glob("*.yaml"):
                 try:
-                    with open(yaml_file, encoding="utf-8") as f:
-                        raw_data = yaml.safe_load(f) or {}
+                    raw_data = await _load_yaml(yaml_file) or {}
                     category_name = raw_data.get("name")
                     if isinstance(category_name, str) and category_name.strip():
                         active_category_names_on_disk.add(category_name.strip())
 
-                    cat_result = await self._sync_category(yaml_file)
+                    cat_result = await self._sync_category(yaml_file, raw_data)
                     results["categories"]["created"] += cat_result.get("created", 0)
                     results["categories"]["updated"] += cat_result.get("updated", 0)
                 except Exception as e:
@@ -168,8 +184,7 @@ class CategorySyncService:
 
     async def _sync_item_group(self, yaml_file: Path) -> dict[str, int]:
         """Sync a single item group from YAML file."""
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = await _load_yaml(yaml_file)
 
         result = {"created": 0, "updated": 0, "items_created": 0, "items_updated": 0}
 
@@ -194,13 +209,19 @@ class CategorySyncService:
             group.icon_url = data.get("icon_url")
             result["updated"] = 1
 
-        # Sync items in this group
-        for item_data in data.get("items", []):
-            item_name = item_data["name"]
-            existing_item = await self.session.execute(
-                select(Item).where(Item.name == item_name, Item.group_id == group.id)
+        # Sync items in this group, looking up existing ones in one query
+        items_data = data.get("items", [])
+        existing_items = await self.session.execute(
+            select(Item).where(
+                Item.group_id == group.id,
+                Item.name.in_({item_data["name"] for item_data in items_data}),
             )
-            item = existing_item.scalar_one_or_none()
+        )
+        items_by_name = {item.name: item for item in existing_items.scalars()}
+
+        for item_data in items_data:
+            item_name = item_data["name"]
+            item = items_by_name.get(item_name)
 
             if item is None:
                 item = Item(
@@ -210,6 +231,7 @@ class CategorySyncService:
                     metadata_=item_data.get("metadata", {}),
                 )
                 self.session.add(item)
+                items_by_name[item_name] = item
                 result["items_created"] += 1
             else:
                 item.image_url = item_data.get("image_url")
@@ -219,10 +241,12 @@ class CategorySyncService:
         await self.session.flush()
         return result
 
-    async def _sync_category(self, yaml_file: Path) -> dict[str, int]:
-        """Sync a single category from YAML file."""
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+    async def _sync_category(
+        self, yaml_file: Path, data: Optional[dict[str, Any]] = None
+    ) -> dict[str, int]:
+        """Sync a single category from YAML file (or its already-parsed data)."""
+        if data is None:
+            data = await _load_yaml(yaml_file)
 
         result = {"created": 0, "updated": 0}
 
@@ -287,28 +311,62 @@ class CategorySyncService:
                 item_ids = [item.id for item in items]
 
         elif "items" in data:
-            # Explicit item names
-            for item_name in data["items"]:
-                item_result = await self.session.execute(
-                    select(Item).where(Item.name == item_name)
-                )
-                item = item_result.scalar_one_or_none()
-                if item:
-                    item_ids.append(item.id)
-
-        # Clear existing category items and add new ones
-        await self.session.execute(
-            CategoryItem.__table__.delete().where(
-                CategoryItem.category_id == category.id
+            # Explicit item names, resolved in one query
+            item_result = await self.session.execute(
+                select(Item.name, Item.id).where(Item.name.in_(set(data["items"])))
             )
+            ids_by_name: dict[str, int] = {}
+            for item_name, item_id in item_result.tuples():
+                if item_name in ids_by_name:
+                    raise ValueError(f"Item name is ambiguous: {item_name}")
+                ids_by_name[item_name] = item_id
+            item_ids = [
+                ids_by_name[item_name]
+                for item_name in data["items"]
+                if item_name in ids_by_name
+            ]
+
+        await self._set_category_items(category.id, item_ids)
+
+    async def _set_category_items(
+        self, category_id: int, item_ids: list[int]
+    ) -> None:
+        """Link exactly `item_ids` to a category, touching only changed rows."""
+        current_result = await self.session.execute(
+            select(CategoryItem.item_id).where(CategoryItem.category_id == category_id)
         )
-        await self.session.flush()
+        current = set(current_result.scalars())
+        target = set(item_ids)
 
-        for item_id in item_ids:
-            cat_item = CategoryItem(category_id=category.id, item_id=item_id)
-            self.session.add(cat_item)
+        to_remove = current - target
+        if to_remove:
+            await self.session.execute(
+                CategoryItem.__table__.delete().where(
+                    CategoryItem.category_id == category_id,
+                    CategoryItem.item_id.in_(to_remove),
+                )
+            )
 
-        await self.session.flush()
+        # New links keep the YAML order, which becomes their insertion order
+        to_add = [i for i in dict.fromkeys(item_ids) if i not in current]
+        if len(to_add) >= _COPY_MIN_ROWS:
+            # Large first-time links go over COPY on the session's connection
+            connection = await self.session.connection()
+            raw = await connection.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                CategoryItem.__tablename__,
+                schema_name="voting",
+                columns=["category_id", "item_id"],
+                records=[(category_id, item_id) for item_id in to_add],
+            )
+        elif to_add:
+            await self.session.execute(
+                insert(CategoryItem),
+                [
+                    {"category_id": category_id, "item_id": item_id}
+                    for item_id in to_add
+                ],
+            )
 
     async def _get_filtered_items(
         self,
@@ -346,8 +404,7 @@ class CategorySyncService:
 
         Each survey question is expanded into one category plus one generated item group.
         """
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = await _load_yaml(yaml_file) or {}
 
         survey_config = data.get("survey", {})
         survey_key = str(survey_config.get("key", yaml_file.stem)).strip() or yaml_file.stem
@@ -429,7 +486,12 @@ class CategorySyncService:
             else:
                 group.description = group_description
 
-            item_ids: list[int] = []
+            existing_items = await self.session.execute(
+                select(Item).where(Item.group_id == group.id)
+            )
+            items_by_name = {item.name: item for item in existing_items.scalars()}
+
+            option_items: list[Item] = []
             for option in options:
                 if isinstance(option, str):
                     option_name = option
@@ -447,10 +509,7 @@ class CategorySyncService:
                 if not option_name:
                     raise ValueError(f"Survey question {question_id} has option with empty name")
 
-                existing_item = await self.session.execute(
-                    select(Item).where(Item.name == option_name, Item.group_id == group.id)
-                )
-                item = existing_item.scalar_one_or_none()
+                item = items_by_name.get(option_name)
                 if item is None:
                     item = Item(
                         group_id=group.id,
@@ -459,12 +518,16 @@ class CategorySyncService:
                         metadata_=option_metadata,
                     )
                     self.session.add(item)
-                    await self.session.flush()
+                    items_by_name[option_name] = item
                 else:
                     item.image_url = option_image_url
                     item.metadata_ = option_metadata
 
-                item_ids.append(item.id)
+                option_items.append(item)
+
+            # One flush assigns ids to every new option
+            await self.session.flush()
+            item_ids = [item.id for item in option_items]
 
             question_discord_required = bool(
                 question.get("discord_required", default_discord_required)
@@ -553,17 +616,7 @@ class CategorySyncService:
                 category.settings = settings
                 result["updated"] += 1
 
-            await self.session.execute(
-                CategoryItem.__table__.delete().where(
-                    CategoryItem.category_id == category.id
-                )
-            )
-            await self.session.flush()
-
-            for item_id in item_ids:
-                self.session.add(CategoryItem(category_id=category.id, item_id=item_id))
-
-            await self.session.flush()
+            await self._set_category_items(category.id, item_ids)
             synced_category_names.add(question_name)
 
         if deactivate_missing:
@@ -610,8 +663,7 @@ class CategorySyncService:
         Creates a single category with all tournaments as items.
         Uses tournament_tiers comparison mode for multi-item tier voting.
         """
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = await _load_yaml(yaml_file)
 
         result = {"created": 0, "updated": 0, "deleted": 0, "closed": 0}
 
@@ -643,6 +695,9 @@ class CategorySyncService:
             await self.session.execute(
                 EloRating.__table__.delete().where(EloRating.category_id == old_cat.id)
             )
+            await self.session.execute(
+                VoteTally.__table__.delete().where(VoteTally.category_id == old_cat.id)
+            )
 
             await self.session.delete(old_cat)
             result["deleted"] += 1
@@ -668,15 +723,16 @@ class CategorySyncService:
             await self.session.flush()
 
         # Create/update items for each tournament
-        tournament_item_ids = []
+        existing_items = await self.session.execute(
+            select(Item).where(Item.group_id == group.id)
+        )
+        items_by_name = {item.name: item for item in existing_items.scalars()}
+
+        tournament_items: list[Item] = []
         for tournament in tournaments:
             tournament_id = tournament.get("id")
             item_name = f"tournament:{tournament_id}"
-
-            item_result = await self.session.execute(
-                select(Item).where(Item.name == item_name, Item.group_id == group.id)
-            )
-            item = item_result.scalar_one_or_none()
+            item = items_by_name.get(item_name)
 
             # Store tournament data in item metadata
             item_metadata = {
@@ -694,11 +750,15 @@ class CategorySyncService:
                     metadata_=item_metadata,
                 )
                 self.session.add(item)
-                await self.session.flush()
+                items_by_name[item_name] = item
             else:
                 item.metadata_ = item_metadata
 
-            tournament_item_ids.append(item.id)
+            tournament_items.append(item)
+
+        # One flush assigns ids to every new tournament item
+        await self.session.flush()
+        tournament_item_ids = [item.id for item in tournament_items]
 
         # Build category settings
         settings = {
@@ -757,17 +817,6 @@ class CategorySyncService:
             category.settings = settings
             result["updated"] = 1
 
-        # Clear existing category items and link tournament items
-        await self.session.execute(
-            CategoryItem.__table__.delete().where(
-                CategoryItem.category_id == category.id
-            )
-        )
-        await self.session.flush()
-
-        for item_id in tournament_item_ids:
-            cat_item = CategoryItem(category_id=category.id, item_id=item_id)
-            self.session.add(cat_item)
-
-        await self.session.flush()
+        # Link tournament items, dropping any removed from the file
+        await self._set_category_items(category.id, tournament_item_ids)
         return result
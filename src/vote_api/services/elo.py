@@ -1,13 +1,17 @@
 """ELO rating system for tournament-style voting."""
 
-from datetime import datetime
+import math
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from vote_api.models.database import EloRating
 
+# 10 ** (x / 400) == exp(x * ln(10) / 400)
+_LN10_OVER_400 = math.log(10) / 400.0
+
 
 def calculate_elo_update(
     winner_rating: float,
@@ -27,17 +31,15 @@ def calculate_elo_update(
         k_factor: Maximum rating change per game (higher = more volatile)
 
     Returns:
-        (new_winner_rating, new_loser_rating)
+        (new_winner_rating, new_loser_rating), unrounded; results round
+        ratings for display.
     """
-    # Expected score for winner (probability of winning)
-    expected_winner = 1 / (1 + 10 ** ((loser_rating - winner_rating) / 400))
-    expected_loser = 1 - expected_winner
-
-    # Actual scores: winner = 1, loser = 0
-    new_winner = winner_rating + k_factor * (1 - expected_winner)
-    new_loser = loser_rating + k_factor * (0 - expected_loser)
+    # The winner gains k * (1 - expected_winner) and the loser loses the
+    # same amount; 1 - expected_winner is the loser's expected score,
+    # 1 / (1 + 10 ** ((winner - loser) / 400)), computed via exp.
+    delta = k_factor / (1.0 + math.exp((winner_rating - loser_rating) * _LN10_OVER_400))
 
-    return (round(new_winner, 2), round(new_loser, 2))
+    return (winner_rating + delta, loser_rating - delta)
 
 
 class EloService:
@@ -53,32 +55,6 @@ class EloService:
         self.initial_rating = initial_rating
         self.k_factor = k_factor
 
-    async def get_or_create_rating(
-        self,
-        category_id: int,
-        item_id: int,
-    ) -> EloRating:
-        """Get existing rating or create a new one with initial rating."""
-        result = await self.session.execute(
-            select(EloRating).where(
-                EloRating.category_id == category_id,
-                EloRating.item_id == item_id,
-            )
-        )
-        rating = result.scalar_one_or_none()
-
-        if rating is None:
-            rating = EloRating(
-                category_id=category_id,
-                item_id=item_id,
-                rating=self.initial_rating,
-                games_played=0,
-            )
-            self.session.add(rating)
-            await self.session.flush()
-
-        return rating
-
     async def record_match(
         self,
         category_id: int,
@@ -88,6 +64,9 @@ class EloService:
         """
         Record a match result and update ELO ratings.
 
+        Both ratings are read (and row-locked) in one query, and both new
+        ratings are written back in one upsert, creating missing rows.
+
         Args:
             category_id: The category this match belongs to
             winner_id: Item ID of the winner
@@ -96,20 +75,52 @@ class EloService:
         Returns:
             (new_winner_rating, new_loser_rating)
         """
-        winner = await self.get_or_create_rating(category_id, winner_id)
-        loser = await self.get_or_create_rating(category_id, loser_id)
+        result = await self.session.execute(
+            select(EloRating.item_id, EloRating.rating)
+            .where(
+                EloRating.category_id == category_id,
+                EloRating.item_id.in_((winner_id, loser_id)),
+            )
+            .order_by(EloRating.item_id)
+            .with_for_update()
+        )
+        ratings = dict(result.tuples().all())
 
         new_winner_rating, new_loser_rating = calculate_elo_update(
-            winner.rating, loser.rating, self.k_factor
+            ratings.get(winner_id, self.initial_rating),
+            ratings.get(loser_id, self.initial_rating),
+            self.k_factor,
         )
 
-        winner.rating = new_winner_rating
-        winner.games_played += 1
-        winner.updated_at = datetime.utcnow()
-
-        loser.rating = new_loser_rating
-        loser.games_played += 1
-        loser.updated_at = datetime.utcnow()
+        # Rows in item order so concurrent matches lock them consistently
+        rows = sorted(
+            (
+                {
+                    "category_id": category_id,
+                    "item_id": winner_id,
+                    "rating": new_winner_rating,
+                    "games_played": 1,
+                },
+                {
+                    "category_id": category_id,
+                    "item_id": loser_id,
+                    "rating": new_loser_rating,
+                    "games_played": 1,
+                },
+            ),
+            key=lambda row: row["item_id"],
+        )
+        stmt = pg_insert(EloRating).values(rows)
+        await self.session.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_elo_per_item",
+                set_={
+                    "rating": stmt.excluded.rating,
+                    "games_played": EloRating.games_played + 1,
+                    "updated_at": func.now(),
+                },
+            )
+        )
 
         return (new_winner_rating, new_loser_rating)
 
@@ -2,15 +2,31 @@
 
 import hashlib
 import os
+import re
 import time
+from functools import lru_cache
 from typing import Optional
 
 import redis
+import redis.asyncio as aioredis
 from fastapi import Request
 
 
 def get_client_ip(request: Request) -> str:
-    """Extract client IP from request, respecting proxy headers."""
+    """Extract client IP from request, respecting proxy headers.
+
+    The result is cached on `request.state`, which middleware and route
+    handlers share, so headers are parsed at most once per request.
+    """
+    cached = getattr(request.state, "client_ip", None)
+    if cached is not None:
+        return cached
+    ip = _parse_client_ip(request)
+    request.state.client_ip = ip
+    return ip
+
+
+def _parse_client_ip(request: Request) -> str:
     # Check X-Forwarded-For header (set by nginx/load balancers)
     forwarded_for = request.headers.get("X-Forwarded-For")
     if forwarded_for:
@@ -29,40 +45,74 @@ def get_client_ip(request: Request) -> str:
     return "unknown"
 
 
-def hash_ip(ip: str) -> str:
-    """Hash IP address with server-side pepper for privacy."""
+def hash_ip(ip: str) -> bytes:
+    """Hash IP address with server-side pepper for privacy.
+
+    Returns a 16-byte keyed BLAKE2s digest: a pseudonym, not a signature.
+    """
     pepper = os.getenv("VOTE_IP_PEPPER")
     if not pepper:
         raise RuntimeError(
             "VOTE_IP_PEPPER environment variable is required for security. "
             "Set it to a strong random string."
         )
-    return hashlib.sha256((pepper + ip).encode()).hexdigest()
+    return _peppered_digest(pepper, ip)
+
+
+@lru_cache(maxsize=4096)
+def _peppered_digest(pepper: str, ip: str) -> bytes:
+    # Voters repeat requests from the same IP; keyed on the pepper too so a
+    # changed secret never serves old digests.
+    return hashlib.blake2s(
+        ip.encode(), key=_pepper_key(pepper), digest_size=16
+    ).digest()
+
+
+@lru_cache(maxsize=4)
+def _pepper_key(pepper: str) -> bytes:
+    # BLAKE2s keys are capped at 32 bytes, so derive one from any length pepper
+    return hashlib.blake2s(pepper.encode()).digest()
+
+
+_is_hex_64 = re.compile(r"[0-9a-fA-F]{64}").fullmatch
+
+
+@lru_cache(maxsize=4096)
+def _decode_fingerprint(fingerprint: str) -> Optional[bytes]:
+    """Return the 32-byte digest a fingerprint encodes, or None if invalid."""
+    # Checked up front so bad input never reaches bytes.fromhex, which
+    # raises on bad digits and silently skips whitespace
+    if len(fingerprint) != 64 or _is_hex_64(fingerprint) is None:
+        return None
+    return bytes.fromhex(fingerprint)
 
 
 def validate_fingerprint(fingerprint: str) -> bool:
     """Validate fingerprint format (SHA-256 hex string)."""
-    if len(fingerprint) != 64:
-        return False
-    try:
-        int(fingerprint, 16)
-        return True
-    except ValueError:
-        return False
+    return _decode_fingerprint(fingerprint) is not None
+
+
+def get_vote_identity(request: Request, fingerprint: str) -> tuple[bytes, bytes]:
+    """Return (fingerprint_hash, ip_hash) digests for vote deduplication.
 
+    Expects a fingerprint that passed `validate_fingerprint`; the decoded
+    digest is shared with that check through the same cache.
+    """
+    # Fingerprint is already hashed client-side; just decode the hex
+    fingerprint_hash = _decode_fingerprint(fingerprint)
+    if fingerprint_hash is None:
+        raise ValueError("Invalid fingerprint format")
+    return (fingerprint_hash, hash_ip(get_client_ip(request)))
 
-def get_vote_identity(request: Request, fingerprint: str) -> tuple[str, str]:
-    """Return (fingerprint_hash, ip_hash) for vote deduplication."""
-    ip = get_client_ip(request)
-    ip_hash = hash_ip(ip)
-    # Fingerprint is already hashed client-side, use as-is
-    return (fingerprint, ip_hash)
+
+_IP_FPS_PREFIX, _IP_FPS_SUFFIX = b"vote:anti:ip:", b":fps"
+_FP_IPS_PREFIX, _FP_IPS_SUFFIX = b"vote:anti:fp:", b":ips"
 
 
 class AntiManipulationService:
     """Service for detecting suspicious voting patterns."""
 
-    def __init__(self, redis_client: redis.Redis):
+    def __init__(self, redis_client: aioredis.Redis):
         self.redis = redis_client
         self.max_fingerprints_per_ip = int(
             os.getenv("MAX_FINGERPRINTS_PER_IP", "5")
@@ -73,29 +123,33 @@ class AntiManipulationService:
         self.fingerprint_window_seconds = 3600  # 1 hour
         self.ip_window_seconds = 86400  # 24 hours
 
-    def check_suspicious_patterns(
-        self, ip_hash: str, fingerprint: str
+    async def check_suspicious_patterns(
+        self, ip_hash: bytes, fingerprint: bytes
     ) -> tuple[bool, Optional[str]]:
         """
         Check for suspicious voting patterns.
         Returns (is_suspicious, reason) tuple.
         """
+        # Raw digests go into keys and members as-is; these sets are only
+        # ever counted, never read back, so they needn't be hex text
+        ip_fingerprints_key = _IP_FPS_PREFIX + ip_hash + _IP_FPS_SUFFIX
+        fp_ips_key = _FP_IPS_PREFIX + fingerprint + _FP_IPS_SUFFIX
         try:
-            # Check 1: Same IP, multiple fingerprints in short time
-            ip_fingerprints_key = f"vote:anti:ip:{ip_hash}:fps"
-            self.redis.sadd(ip_fingerprints_key, fingerprint)
-            self.redis.expire(ip_fingerprints_key, self.fingerprint_window_seconds)
+            # Both sets are updated and counted in one round-trip
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.sadd(ip_fingerprints_key, fingerprint)
+            pipe.expire(ip_fingerprints_key, self.fingerprint_window_seconds)
+            pipe.scard(ip_fingerprints_key)
+            pipe.sadd(fp_ips_key, ip_hash)
+            pipe.expire(fp_ips_key, self.ip_window_seconds)
+            pipe.scard(fp_ips_key)
+            _, _, unique_fps, _, _, unique_ips = await pipe.execute()
 
-            unique_fps = self.redis.scard(ip_fingerprints_key)
+            # Check 1: Same IP, multiple fingerprints in short time
             if unique_fps and unique_fps > self.max_fingerprints_per_ip:
                 return (True, "Too many different devices from same IP")
 
             # Check 2: Fingerprint appeared from too many IPs
-            fp_ips_key = f"vote:anti:fp:{fingerprint}:ips"
-            self.redis.sadd(fp_ips_key, ip_hash)
-            self.redis.expire(fp_ips_key, self.ip_window_seconds)
-
-            unique_ips = self.redis.scard(fp_ips_key)
             if unique_ips and unique_ips > self.max_ips_per_fingerprint:
                 return (True, "Device seen from too many different IPs")
 
@@ -105,18 +159,21 @@ class AntiManipulationService:
             # Fail open - allow vote if Redis is unavailable
             return (False, None)
 
-    def record_vote_attempt(
+    async def record_vote_attempt(
         self,
-        ip_hash: str,
-        fingerprint: str,
+        ip_hash: bytes,
+        fingerprint: bytes,
         category_id: int,
         success: bool,
     ) -> None:
         """Record vote attempt for pattern analysis."""
+        ip_hash, fingerprint = ip_hash.hex(), fingerprint.hex()
         try:
             timestamp = int(time.time())
             key = f"vote:attempts:{timestamp // 3600}"  # Hourly buckets
-            self.redis.hincrby(key, f"{ip_hash}:{fingerprint}:{category_id}:{success}", 1)
-            self.redis.expire(key, 86400 * 7)  # Keep for 7 days
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.hincrby(key, f"{ip_hash}:{fingerprint}:{category_id}:{success}", 1)
+            pipe.expire(key, 86400 * 7)  # Keep for 7 days
+            await pipe.execute()
         except redis.RedisError:
             pass  # Non-critical, fail silently
@@ -0,0 +1,58 @@
+"""Short-lived cache of serialized results responses."""
+
+import os
+from typing import Optional
+
+import redis
+import redis.asyncio as aioredis
+
+
+class ResultsCache:
+    """Results bodies keyed by a per-category vote generation.
+
+    Every committed vote bumps the category's generation, so a new vote
+    moves readers to a fresh key instead of deleting the old one; the short
+    TTL cleans up superseded entries. All operations fail open when Redis
+    is unavailable.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis):
+        self.redis = redis_client
+        self.ttl_seconds = int(os.getenv("RESULTS_CACHE_TTL", "5"))
+
+    @staticmethod
+    def generation_key(category_id: int) -> str:
+        return f"vote:gen:{category_id}"
+
+    @staticmethod
+    def results_key(category_id: int, generation: str) -> str:
+        return f"vote:cache:results:{category_id}:{generation}"
+
+    async def get(self, category_id: int) -> tuple[Optional[str], Optional[str]]:
+        """Return (generation, cached body) for a category.
+
+        The generation is None when Redis is unavailable, which also means
+        the result should not be cached.
+        """
+        try:
+            generation = await self.redis.get(self.generation_key(category_id)) or "0"
+            body = await self.redis.get(self.results_key(category_id, generation))
+            return generation, body
+        except redis.RedisError:
+            return None, None
+
+    async def set(self, category_id: int, generation: str, body: str) -> None:
+        """Store a results body computed at `generation`."""
+        try:
+            await self.redis.set(
+                self.results_key(category_id, generation), body, ex=self.ttl_seconds
+            )
+        except redis.RedisError:
+            pass  # Non-critical, fail silently
+
+    async def bump(self, category_id: int) -> None:
+        """Move readers past any results cached before a new vote."""
+        try:
+            await self.redis.incr(self.generation_key(category_id))
+        except redis.RedisError:
+            pass  # Non-critical, fail silently
@@ -1,8 +1,16 @@
 """Statistical calculations for voting results."""
 
 import math
+from collections import defaultdict
 from typing import Optional
 
+# (z, z**2) for common confidence levels; anything else falls back to 95%
+_Z_SCORES = {
+    confidence: (z, z * z)
+    for confidence, z in {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}.items()
+}
+_Z_DEFAULT = _Z_SCORES[0.95]
+
 
 def calculate_percentage(votes: int, total: int) -> float:
     """Calculate simple percentage."""
@@ -33,21 +41,67 @@ def wilson_confidence_interval(
     if total == 0:
         return (0.0, 0.0)
 
-    # Z-score for common confidence levels
-    z_scores = {0.90: 1.645, 0.95: 1.96, 0.99: 2.576}
-    z = z_scores.get(confidence, 1.96)
+    z, z2 = _Z_SCORES.get(confidence, _Z_DEFAULT)
+    inv_total = 1.0 / total
+    z2_over_total = z2 * inv_total
 
-    p = successes / total
-    denominator = 1 + z**2 / total
-    center = (p + z**2 / (2 * total)) / denominator
-    spread = z * math.sqrt((p * (1 - p) + z**2 / (4 * total)) / total) / denominator
+    p = successes * inv_total
+    denominator = 1.0 + z2_over_total
+    center = (p + 0.5 * z2_over_total) / denominator
+    spread = (
+        z * math.sqrt((p * (1.0 - p) + 0.25 * z2_over_total) * inv_total) / denominator
+    )
 
-    lower = max(0, center - spread) * 100
-    upper = min(1, center + spread) * 100
+    lower = max(0.0, center - spread) * 100
+    upper = min(1.0, center + spread) * 100
 
     return (round(lower, 2), round(upper, 2))
 
 
+def wilson_confidence_intervals(
+    counts: list[int],
+    total: int,
+    confidence: float = 0.95,
+) -> list[tuple[float, float]]:
+    """
+    Wilson score intervals for many items sharing the same total.
+
+    Same result as calling `wilson_confidence_interval` per count, but the
+    terms that depend only on `total` are computed once and items with equal
+    counts (e.g. all the zero-vote ones) share a single computation.
+
+    Args:
+        counts: Successes per item
+        total: Total number of trials (total votes)
+        confidence: Confidence level (0.90, 0.95, or 0.99)
+
+    Returns:
+        (lower_bound, upper_bound) percentages, in the order of `counts`
+    """
+    if total == 0:
+        return [(0.0, 0.0)] * len(counts)
+
+    z, z2 = _Z_SCORES.get(confidence, _Z_DEFAULT)
+    inv_total = 1.0 / total
+    z2_over_total = z2 * inv_total
+    denominator = 1.0 + z2_over_total
+    center_offset = 0.5 * z2_over_total
+    spread_offset = 0.25 * z2_over_total
+
+    intervals: dict[int, tuple[float, float]] = {}
+    for successes in counts:
+        if successes in intervals:
+            continue
+        p = successes * inv_total
+        center = (p + center_offset) / denominator
+        spread = z * math.sqrt((p * (1 - p) + spread_offset) * inv_total) / denominator
+        intervals[successes] = (
+            round(max(0.0, center - spread) * 100, 2),
+            round(min(1.0, center + spread) * 100, 2),
+        )
+    return [intervals[successes] for successes in counts]
+
+
 def calculate_average_rank(
     rankings: list[Optional[int]],
 ) -> Optional[float]:
@@ -85,12 +139,11 @@ def borda_count(
     Returns:
         Dictionary mapping item_id to total Borda score
     """
-    scores: dict[int, int] = {}
+    scores: defaultdict[int, int] = defaultdict(int)
 
     for ranking in rankings:
-        for position, item_id in enumerate(ranking):
-            # Higher rank = more points (N-1 for 1st, N-2 for 2nd, etc.)
-            points = len(ranking) - 1 - position
-            scores[item_id] = scores.get(item_id, 0) + points
+        # Higher rank = more points (N-1 for 1st, N-2 for 2nd, etc.)
+        for item_id, points in zip(ranking, range(len(ranking) - 1, -1, -1)):
+            scores[item_id] += points
 
-    return scores
+    return dict(scores)
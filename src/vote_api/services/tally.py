@@ -0,0 +1,145 @@
+"""Write-time vote tallies backing the results endpoints."""
+
+from collections import Counter, defaultdict
+from typing import Iterable, Optional
+
+from sqlalchemy import BigInteger, and_, cast, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from vote_api.models.database import CategoryItem, VoteTally
+
+
+class TallyService:
+    """Keeps `VoteTally` in step with the vote choices being written.
+
+    Call it in the same transaction that inserts or changes `VoteChoice`
+    rows so the tallies commit (or roll back) together with the votes.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def apply(
+        self,
+        category_id: int,
+        choices: Iterable[tuple[int, Optional[int]]],
+        delta: int = 1,
+    ) -> None:
+        """Add `delta` to the bucket of each (item_id, rank) choice."""
+        buckets = Counter((item_id, rank or 0) for item_id, rank in choices)
+        await self._add(
+            category_id, {bucket: count * delta for bucket, count in buckets.items()}
+        )
+
+    async def move(
+        self, category_id: int, item_id: int, old_rank: Optional[int], new_rank: int
+    ) -> None:
+        """Move one choice from its old rank bucket to a new one."""
+        if (old_rank or 0) == new_rank:
+            return
+        await self._add(
+            category_id, {(item_id, old_rank or 0): -1, (item_id, new_rank): 1}
+        )
+
+    async def _add(
+        self, category_id: int, deltas: dict[tuple[int, int], int]
+    ) -> None:
+        """Upsert {(item_id, rank): delta} into the tallies in one statement."""
+        if not deltas:
+            return
+
+        # Sorted so concurrent voters lock hot rows in the same order
+        rows = [
+            {
+                "category_id": category_id,
+                "item_id": item_id,
+                "rank": rank,
+                "vote_count": delta,
+            }
+            for (item_id, rank), delta in sorted(deltas.items())
+        ]
+        stmt = insert(VoteTally).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["category_id", "item_id", "rank"],
+            set_={"vote_count": VoteTally.vote_count + stmt.excluded.vote_count},
+        )
+        await self.session.execute(stmt)
+
+    async def get_summary(
+        self, category_id: int, by_average_rank: bool = False
+    ) -> list[tuple[int, int, int, int]]:
+        """Return (item_id, vote_count, rank_sum, first_place) per category item.
+
+        Aggregated and ordered in SQL: by vote count descending, or by
+        average rank ascending when `by_average_rank` is set. The tallies are
+        left-joined onto the category's items, so items with no votes come
+        back as zero rows at the end.
+        """
+        vote_count = cast(func.coalesce(func.sum(VoteTally.vote_count), 0), BigInteger)
+        rank_sum = cast(
+            func.coalesce(func.sum(VoteTally.rank * VoteTally.vote_count), 0),
+            BigInteger,
+        )
+        first_place = cast(
+            func.coalesce(
+                func.sum(VoteTally.vote_count).filter(VoteTally.rank == 1), 0
+            ),
+            BigInteger,
+        ).label("first_place")
+        order = (
+            (rank_sum * 1.0 / func.nullif(vote_count, 0)).asc().nulls_last()
+            if by_average_rank
+            else vote_count.desc()
+        )
+        result = await self.session.execute(
+            select(
+                CategoryItem.item_id,
+                vote_count.label("vote_count"),
+                rank_sum.label("rank_sum"),
+                first_place,
+            )
+            .select_from(CategoryItem)
+            .outerjoin(
+                VoteTally,
+                and_(
+                    VoteTally.category_id == CategoryItem.category_id,
+                    VoteTally.item_id == CategoryItem.item_id,
+                    VoteTally.vote_count > 0,
+                ),
+            )
+            .where(CategoryItem.category_id == category_id)
+            .group_by(CategoryItem.item_id)
+            .order_by(order, CategoryItem.item_id)
+        )
+        return [tuple(row) for row in result.all()]
+
+    async def get_counts(
+        self, category_id: int, average_below: Optional[int] = None
+    ) -> dict[int, dict[int, int]]:
+        """Return {item_id: {rank: count}} for a category.
+
+        With `average_below`, items come back ordered by their average rank
+        over the buckets below that rank (best first, items with none last).
+        """
+        query = select(VoteTally.item_id, VoteTally.rank, VoteTally.vote_count).where(
+            VoteTally.category_id == category_id,
+            VoteTally.vote_count > 0,
+        )
+        if average_below is not None:
+            counted = VoteTally.rank < average_below
+            per_item = {"partition_by": VoteTally.item_id}
+            average = func.sum(VoteTally.rank * VoteTally.vote_count).filter(
+                counted
+            ).over(**per_item) / func.nullif(
+                func.sum(VoteTally.vote_count).filter(counted).over(**per_item), 0
+            )
+            query = query.order_by(
+                average.asc().nulls_last(), VoteTally.item_id, VoteTally.rank
+            )
+
+        result = await self.session.execute(query)
+        counts: dict[int, dict[int, int]] = defaultdict(dict)
+        for item_id, rank, vote_count in result.all():
+            counts[item_id][rank] = vote_count
+        return counts
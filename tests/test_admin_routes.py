@@ -0,0 +1,61 @@
+"""Tests for admin list pagination defaults."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from vote_api.connections import get_db_session
+from vote_api.routes import admin
+
+
+class _EmptyResult:
+    def all(self):
+        return []
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _EmptyResult()
+
+
+@pytest.fixture
+def admin_api():
+    session = _CapturingSession()
+    app = FastAPI()
+    app.include_router(admin.router)
+    app.dependency_overrides[get_db_session] = lambda: session
+    app.dependency_overrides[admin.verify_admin_token] = lambda: True
+    return TestClient(app), session
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/v1/admin/categories", "/api/v1/admin/comments/pending"]
+)
+def test_admin_lists_are_unpaginated_by_default(admin_api, path):
+    client, session = admin_api
+
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+    (statement,) = session.statements
+    assert statement._limit_clause is None
+
+
+@pytest.mark.parametrize(
+    "path", ["/api/v1/admin/categories", "/api/v1/admin/comments/pending"]
+)
+def test_admin_lists_apply_an_explicit_limit(admin_api, path):
+    client, session = admin_api
+
+    response = client.get(path, params={"limit": 10})
+
+    assert response.status_code == 200
+    (statement,) = session.statements
+    assert statement._limit == 10
@@ -0,0 +1,90 @@
+"""Tests that category eager loads raise on undeclared relationship access."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy.pool import StaticPool
+
+from vote_api.models.database import Base, Category, CategoryItem, Item, ItemGroup
+from vote_api.routes.categories import _category_items_loader
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _attach_schema(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS voting")
+
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            ItemGroup.__table__,
+            Item.__table__,
+            Category.__table__,
+            CategoryItem.__table__,
+        ],
+    )
+    with Session(engine) as seed:
+        group = ItemGroup(id=1, name="Weapons")
+        item = Item(id=1, group=group, name="Splattershot", metadata_={})
+        category = Category(
+            id=1, name="Best weapon", comparison_mode="single_choice", settings={}
+        )
+        seed.add_all([group, item, category])
+        seed.add(CategoryItem(category_id=1, item_id=1))
+        seed.commit()
+
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def _load_category(session: Session) -> Category:
+    return session.scalars(
+        select(Category).options(_category_items_loader(), raiseload("*"))
+    ).one()
+
+
+def test_declared_relationships_are_loaded(session):
+    category = _load_category(session)
+
+    (category_item,) = category.category_items
+    assert category_item.item.name == "Splattershot"
+    assert category_item.item.group.name == "Weapons"
+
+
+@pytest.mark.parametrize(
+    "access",
+    [
+        pytest.param(lambda category: category.votes, id="Category.votes"),
+        pytest.param(
+            lambda category: category.category_items[0].category,
+            id="CategoryItem.category",
+        ),
+        pytest.param(
+            lambda category: category.category_items[0].item.category_items,
+            id="Item.category_items",
+        ),
+        pytest.param(
+            lambda category: category.category_items[0].item.group.items,
+            id="ItemGroup.items",
+        ),
+    ],
+)
+def test_undeclared_relationship_access_raises(session, access):
+    category = _load_category(session)
+
+    with pytest.raises(InvalidRequestError):
+        access(category)
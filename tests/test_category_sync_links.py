@@ -0,0 +1,69 @@
+"""Tests for category item link reconciliation in category sync."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from vote_api.services import category_sync
+from vote_api.services.category_sync import CategorySyncService
+
+
+class _ScalarResult:
+    def __init__(self, values):
+        self._values = values
+
+    def scalars(self):
+        return iter(self._values)
+
+
+class _FakeSession:
+    def __init__(self, current_item_ids):
+        self._current = current_item_ids
+        self.statements = []
+        self.copied = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        return _ScalarResult(self._current)
+
+    async def connection(self):
+        session = self
+
+        class _Connection:
+            async def get_raw_connection(self):
+                async def copy_records_to_table(table, *, records, **kwargs):
+                    session.copied.extend(records)
+
+                driver = SimpleNamespace(copy_records_to_table=copy_records_to_table)
+                return SimpleNamespace(driver_connection=driver)
+
+        return _Connection()
+
+
+async def test_new_links_keep_yaml_order():
+    session = _FakeSession(current_item_ids=[7])
+
+    await CategorySyncService(session)._set_category_items(1, [30, 7, 2, 30, 15])
+
+    (_, params) = session.statements[-1]
+    assert [row["item_id"] for row in params] == [30, 2, 15]
+    assert {row["category_id"] for row in params} == {1}
+
+
+async def test_unchanged_links_write_nothing():
+    session = _FakeSession(current_item_ids=[2, 7])
+
+    await CategorySyncService(session)._set_category_items(1, [7, 2])
+
+    # Only the lookup of current links ran
+    assert len(session.statements) == 1
+
+
+async def test_copied_links_keep_yaml_order(monkeypatch):
+    monkeypatch.setattr(category_sync, "_COPY_MIN_ROWS", 3)
+    session = _FakeSession(current_item_ids=[])
+
+    await CategorySyncService(session)._set_category_items(1, [9, 4, 9, 6, 1])
+
+    assert session.copied == [(1, 9), (1, 4), (1, 6), (1, 1)]
+    assert len(session.statements) == 1
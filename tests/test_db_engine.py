@@ -0,0 +1,56 @@
+"""Tests for engine configuration in shared_lib.db."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
+
+from shared_lib import db
+
+
+class _Connecting(Exception):
+    pass
+
+
+@pytest.fixture
+def connect_params(monkeypatch):
+    """Build a fresh engine and return the params its first connect would use."""
+
+    async def capture(**env):
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        db.get_engine.cache_clear()
+        engine = db.get_engine(async_driver=True)
+        captured = {}
+
+        @event.listens_for(engine.sync_engine, "do_connect")
+        def _capture(dialect, conn_rec, cargs, cparams):
+            captured.update(cparams)
+            raise _Connecting
+
+        with pytest.raises(_Connecting):
+            async with engine.connect():
+                pass
+        await engine.dispose()
+        return engine, captured
+
+    yield capture
+    db.get_engine.cache_clear()
+
+
+async def test_pgbouncer_disables_statement_caches(connect_params):
+    engine, params = await connect_params(PGBOUNCER="1")
+
+    assert isinstance(engine.pool, NullPool)
+    assert params["statement_cache_size"] == 0
+    assert params["prepared_statement_cache_size"] == 0
+    name_func = params["prepared_statement_name_func"]
+    assert name_func() != name_func()
+
+
+async def test_direct_connections_keep_the_statement_cache(connect_params):
+    _, params = await connect_params(PGBOUNCER="0", DB_STATEMENT_CACHE_SIZE="250")
+
+    assert params["prepared_statement_cache_size"] == 250
+    assert "statement_cache_size" not in params
@@ -0,0 +1,196 @@
+"""Tests for the token-bucket rate limiting middleware."""
+
+from __future__ import annotations
+
+import pytest
+import redis
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from redis.exceptions import NoScriptError
+
+from vote_api import middleware
+
+lupa = pytest.importorskip("lupa")
+
+
+class _LuaRedis:
+    """In-memory stand-in for the rate-limit Redis that runs the real script."""
+
+    def __init__(self):
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.loaded = False
+        self.error: Exception | None = None
+        self._lua = lupa.LuaRuntime()
+        self._script = self._lua.eval(
+            f"function(KEYS, ARGV, redis) {middleware._TOKEN_BUCKET_LUA} end"
+        )
+        self._redis = self._lua.table_from({"call": self._call})
+
+    def _call(self, command, key, *args):
+        if command == "HMGET":
+            stored = self.hashes.get(key, {})
+            return self._lua.table_from([stored.get(f, False) for f in args])
+        if command == "HSET":
+            fields = self.hashes.setdefault(key, {})
+            for field, value in zip(args[::2], args[1::2]):
+                fields[field] = repr(value)
+            return len(args) // 2
+        if command == "PEXPIRE":
+            return 1
+        raise AssertionError(f"unexpected command {command}")
+
+    def _to_python(self, value):
+        # Redis truncates Lua numbers to integers in replies
+        if lupa.lua_type(value) == "table":
+            return [self._to_python(v) for v in value.values()]
+        return int(value)
+
+    async def script_load(self, script):
+        assert script == middleware._TOKEN_BUCKET_LUA
+        self.loaded = True
+
+    async def evalsha(self, sha, numkeys, *args):
+        if self.error is not None:
+            raise self.error
+        if not self.loaded:
+            raise NoScriptError("NOSCRIPT")
+        assert sha == middleware._TOKEN_BUCKET_SHA
+        keys = self._lua.table_from(args[:numkeys])
+        argv = self._lua.table_from(
+            [repr(a) if isinstance(a, float) else str(a) for a in args[numkeys:]]
+        )
+        return self._to_python(self._script(keys, argv, self._redis))
+
+    def tokens(self, prefix: str) -> float:
+        (key,) = [k for k in self.hashes if k.startswith(prefix)]
+        return float(self.hashes[key]["tokens"])
+
+
+@pytest.fixture
+def rate_limited(monkeypatch):
+    monkeypatch.setenv("API_RL_PER_SEC", "2")
+    monkeypatch.setenv("VOTE_RL_PER_MIN", "3")
+
+    fake = _LuaRedis()
+    monkeypatch.setattr(middleware, "get_redis_rl", lambda: fake)
+
+    clock = {"ms": 1_000_000}
+    monkeypatch.setattr(middleware.time, "time_ns", lambda: clock["ms"] * 1_000_000)
+
+    app = FastAPI()
+    app.add_middleware(middleware.RateLimitMiddleware)
+
+    @app.get("/api/v1/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/api/v1/vote")
+    async def vote():
+        return {"ok": True}
+
+    return TestClient(app), fake, clock
+
+
+def test_api_bucket_allows_capacity_then_rejects(rate_limited):
+    client, _, _ = rate_limited
+
+    first = client.get("/api/v1/ping")
+    second = client.get("/api/v1/ping")
+    third = client.get("/api/v1/ping")
+
+    assert (first.status_code, second.status_code) == (200, 200)
+    assert first.headers["X-RateLimit-Limit"] == "2"
+    assert first.headers["X-RateLimit-Remaining"] == "1"
+    assert second.headers["X-RateLimit-Remaining"] == "0"
+    assert third.status_code == 429
+    assert third.json() == {"detail": "Rate limit exceeded"}
+
+
+def test_retry_after_only_on_rejections(rate_limited):
+    client, _, _ = rate_limited
+
+    client.get("/api/v1/ping")
+    # Takes the last token: allowed, so no Retry-After even though the
+    # bucket is now empty
+    last_token = client.get("/api/v1/ping")
+    rejected = client.get("/api/v1/ping")
+
+    assert last_token.status_code == 200
+    assert "Retry-After" not in last_token.headers
+    assert rejected.status_code == 429
+    # 2 tokens/s: the next one is 500ms away, rounded up to whole seconds
+    assert rejected.headers["Retry-After"] == "1"
+
+
+def test_bucket_refills_over_time(rate_limited):
+    client, _, clock = rate_limited
+
+    client.get("/api/v1/ping")
+    client.get("/api/v1/ping")
+    assert client.get("/api/v1/ping").status_code == 429
+
+    clock["ms"] += 500
+    refilled = client.get("/api/v1/ping")
+
+    assert refilled.status_code == 200
+    assert refilled.headers["X-RateLimit-Remaining"] == "0"
+
+
+def test_vote_bucket_limits_votes(rate_limited):
+    client, _, clock = rate_limited
+
+    for _ in range(3):
+        assert client.post("/api/v1/vote").status_code == 200
+        clock["ms"] += 1000  # keep the per-second API bucket out of it
+
+    rejected = client.post("/api/v1/vote")
+
+    assert rejected.status_code == 429
+    assert rejected.json() == {"detail": "Vote rate limit exceeded"}
+    assert rejected.headers["X-RateLimit-Limit"] == "3"
+    # 3 votes/min: 20s per token, less the 3s that already passed
+    assert rejected.headers["Retry-After"] == "17"
+
+
+def test_api_rejection_does_not_charge_vote_bucket(rate_limited):
+    client, fake, _ = rate_limited
+
+    client.get("/api/v1/ping")
+    client.get("/api/v1/ping")
+    rejected = client.post("/api/v1/vote")
+
+    assert rejected.status_code == 429
+    assert rejected.json() == {"detail": "Rate limit exceeded"}
+    assert fake.tokens("vote:rl:vote:") == 3
+
+
+def test_vote_rejection_does_not_charge_api_bucket(rate_limited):
+    client, fake, clock = rate_limited
+
+    for _ in range(3):
+        clock["ms"] += 1000
+        client.post("/api/v1/vote")
+    assert fake.tokens("vote:rl:api:") == 1
+
+    assert client.post("/api/v1/vote").status_code == 429
+    assert fake.tokens("vote:rl:api:") == 1
+
+
+def test_reloads_script_after_noscript(rate_limited):
+    client, fake, _ = rate_limited
+    assert fake.loaded is False
+
+    response = client.get("/api/v1/ping")
+
+    assert response.status_code == 200
+    assert fake.loaded is True
+
+
+def test_fails_open_when_redis_unavailable(rate_limited):
+    client, fake, _ = rate_limited
+    fake.error = redis.ConnectionError("down")
+
+    responses = [client.get("/api/v1/ping") for _ in range(5)]
+
+    assert all(r.status_code == 200 for r in responses)
+    assert "X-RateLimit-Limit" not in responses[0].headers
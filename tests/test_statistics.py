@@ -0,0 +1,33 @@
+"""Tests for the batched Wilson score intervals."""
+
+from __future__ import annotations
+
+import pytest
+
+from vote_api.services.statistics import (
+    wilson_confidence_interval,
+    wilson_confidence_intervals,
+)
+
+
+@pytest.mark.parametrize("confidence", [0.90, 0.95, 0.99, 0.80])
+@pytest.mark.parametrize(
+    ("counts", "total"),
+    [
+        pytest.param([0, 0, 0], 0, id="no-votes"),
+        pytest.param([], 10, id="no-items"),
+        pytest.param([1], 1, id="single-vote"),
+        pytest.param([0, 3, 7, 10], 10, id="spread"),
+        pytest.param([5, 0, 5, 0, 5], 15, id="repeated-counts"),
+        pytest.param([0, 1, 2, 3, 997], 1003, id="skewed"),
+        pytest.param(list(range(0, 10_001, 137)), 10_000, id="large-total"),
+    ],
+)
+def test_batch_matches_scalar(counts, total, confidence):
+    expected = [wilson_confidence_interval(c, total, confidence) for c in counts]
+
+    assert wilson_confidence_intervals(counts, total, confidence) == expected
+
+
+def test_batch_with_no_votes_returns_zero_intervals():
+    assert wilson_confidence_intervals([0, 4], 0) == [(0.0, 0.0), (0.0, 0.0)]
@@ -0,0 +1,89 @@
+"""Tests for the write-time vote tally bucket math."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from vote_api.models.database import VoteTally
+from vote_api.services.tally import TallyService
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+
+
+def tally_deltas(statement) -> dict[tuple[int, int], int]:
+    """{(item_id, rank): delta} from a captured tally upsert."""
+    assert statement.table.name == VoteTally.__tablename__
+    params = statement.compile(dialect=postgresql.dialect()).params
+    rows = sum(1 for name in params if name.startswith("vote_count_m"))
+    return {
+        (params[f"item_id_m{i}"], params[f"rank_m{i}"]): params[f"vote_count_m{i}"]
+        for i in range(rows)
+    }
+
+
+@pytest.fixture
+def session():
+    return _CapturingSession()
+
+
+async def test_apply_counts_each_choice_in_its_rank_bucket(session):
+    await TallyService(session).apply(5, [(10, 1), (11, 2), (12, 3)])
+
+    (statement,) = session.statements
+    assert tally_deltas(statement) == {(10, 1): 1, (11, 2): 1, (12, 3): 1}
+    params = statement.compile(dialect=postgresql.dialect()).params
+    assert {params[f"category_id_m{i}"] for i in range(3)} == {5}
+
+
+async def test_apply_puts_unranked_choices_in_bucket_zero(session):
+    await TallyService(session).apply(5, [(10, None), (11, None)])
+
+    (statement,) = session.statements
+    assert tally_deltas(statement) == {(10, 0): 1, (11, 0): 1}
+
+
+async def test_apply_merges_repeated_buckets_and_scales_by_delta(session):
+    await TallyService(session).apply(5, [(10, None), (10, None), (11, 2)], delta=-1)
+
+    (statement,) = session.statements
+    assert tally_deltas(statement) == {(10, 0): -2, (11, 2): -1}
+
+
+async def test_apply_with_no_choices_skips_the_statement(session):
+    await TallyService(session).apply(5, [])
+
+    assert session.statements == []
+
+
+async def test_move_decrements_old_bucket_and_increments_new(session):
+    await TallyService(session).move(5, 10, old_rank=1, new_rank=4)
+
+    (statement,) = session.statements
+    assert tally_deltas(statement) == {(10, 1): -1, (10, 4): 1}
+
+
+async def test_move_from_unranked_uses_bucket_zero(session):
+    await TallyService(session).move(5, 10, old_rank=None, new_rank=2)
+
+    (statement,) = session.statements
+    assert tally_deltas(statement) == {(10, 0): -1, (10, 2): 1}
+
+
+async def test_move_to_same_tier_is_a_no_op(session):
+    await TallyService(session).move(5, 10, old_rank=3, new_rank=3)
+
+    assert session.statements == []
+
+
+async def test_rows_are_written_in_key_order(session):
+    await TallyService(session).apply(5, [(12, 1), (10, 2), (10, 1)])
+
+    (statement,) = session.statements
+    assert list(tally_deltas(statement)) == [(10, 1), (10, 2), (12, 1)]
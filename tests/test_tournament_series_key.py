@@ -0,0 +1,114 @@
+"""Tests that the folded series-key regex chain matches the original one."""
+
+from __future__ import annotations
+
+import importlib.util
+import random
+import re
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("yaml")
+
+_SCRIPT = Path(__file__).parents[1] / "scripts" / "generate_tournament_tier_polls.py"
+_spec = importlib.util.spec_from_file_location(
+    "generate_tournament_tier_polls", _SCRIPT
+)
+polls = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(polls)
+
+# The eight-pass chain the SQL used before it was folded, innermost first
+OLD_PASSES = [
+    ("[[:space:]]*[+][[:space:]]*.*$", ""),
+    ("season[[:space:]]+[0-9]+", "season"),
+    ("[[:space:]]*[(][^)]*[)][[:space:]]*$", ""),
+    ("[[:space:]]*[-][[:space:]]*division[[:space:]].*$", ""),
+    ("[[:space:]]*#[[:space:]]*[0-9]+.*$", ""),
+    ("[[:space:]]+[0-9]+[[:space:]]*:[[:space:]]*.*$", ""),
+    ("[[:space:]]+[0-9]+[^[:alnum:]]*[[:space:]]*$", ""),
+    ("[^[:alnum:]]+[[:space:]]*$", ""),
+]
+
+
+def sql_passes(sql: str) -> list[tuple[str, str]]:
+    """(pattern, replacement) per regexp_replace, innermost first.
+
+    Nested calls list their arguments inside-out, so the string literals read
+    in order. Literals separated only by a newline are one literal in SQL.
+    """
+    values: list[str] = []
+    end = None
+    for match in re.finditer(r"'((?:[^']|'')*)'", sql):
+        text = match.group(1).replace("''", "'")
+        gap = sql[end : match.start()] if end is not None else ","
+        if not gap.strip() and "\n" in gap:
+            values[-1] += text
+        else:
+            values.append(text)
+        end = match.end()
+    count = sql.count("regexp_replace(")
+    return list(zip(values[: 2 * count : 2], values[1 : 2 * count : 2]))
+
+
+def posix_to_python(pattern: str) -> str:
+    return pattern.replace("[^[:alnum:]]", r"[\W_]").replace("[[:space:]]", r"\s")
+
+
+def series_key(name: str, passes: list[tuple[str, str]]) -> str:
+    """Python rendering of COALESCE(NULLIF(TRIM(<chain>), ''), '(unknown)')."""
+    key = name.lower()
+    for pattern, replacement in passes:
+        # regexp_replace without the 'g' flag replaces the first match only
+        key = re.sub(posix_to_python(pattern), replacement, key, count=1)
+    return key.strip(" ") or "(unknown)"
+
+
+NEW_PASSES = sql_passes(polls._SERIES_KEY_SQL)
+
+NAMES = [
+    "Fry Basket #42",
+    "fry basket #7",
+    "Low Ink March 2024",
+    "LUTI Season 14 - Division 3",
+    "LUTI Season 14 - Division X",
+    "Swim or Sink 30 (Grand Stage)",
+    "Swim or Sink 31",
+    "Paddling Pool 120 + h20",
+    "Paddling Pool (EU) + h20 (NA)",
+    "In The Zone 25: Rainmaker Edition",
+    "Season 3 Finals",
+    "Season 2: Finale",
+    "Splat Zones Only!!",
+    "Kraken Royale (Day 2) (Top Cut)",
+    "Triton Cup 5 -",
+    "Deep Sea Dive 2.",
+    "(Online)",
+    "+++",
+    "   ",
+    "",
+    "Grand Festival 2025 (Season 2) + Co-Host",
+]
+
+
+def test_new_chain_is_four_passes():
+    assert len(NEW_PASSES) == 4
+    assert NEW_PASSES[0] == ("season[[:space:]]+[0-9]+", "season")
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_folded_chain_matches_original(name):
+    assert series_key(name, NEW_PASSES) == series_key(name, OLD_PASSES)
+
+
+def test_folded_chain_matches_original_on_generated_names():
+    tokens = [
+        "Fry", "Basket", "season", "Season", "3", "14", "#", "#2", "+", "h20",
+        "(", ")", "(EU)", "(Grand Stage)", "-", "Division", "X", ":", "2:",
+        "!", ".", "2.", " ", "  ", "é", "_",
+    ]  # fmt: skip
+    rng = random.Random(1234)
+    for _ in range(20_000):
+        name = " ".join(rng.choices(tokens, k=rng.randint(1, 8)))
+        assert series_key(name, NEW_PASSES) == series_key(name, OLD_PASSES), name
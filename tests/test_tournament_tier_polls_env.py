@@ -0,0 +1,49 @@
+"""Tests for the tournament tier poll script's .env loader."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("yaml")
+
+_SCRIPT = Path(__file__).parents[1] / "scripts" / "generate_tournament_tier_polls.py"
+_spec = importlib.util.spec_from_file_location(
+    "generate_tournament_tier_polls", _SCRIPT
+)
+polls = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(polls)
+
+
+def test_env_file_fills_keys_missing_from_configured_environment(tmp_path, monkeypatch):
+    for key in ("HOST", "USER", "PASSWORD", "NAME"):
+        monkeypatch.setenv(f"RANKINGS_DB_{key}", f"from-env-{key.lower()}")
+    for key in ("SCHEMA", "PORT", "SSLMODE"):
+        # setenv first so teardown also removes what the loader adds
+        monkeypatch.setenv(f"RANKINGS_DB_{key}", "")
+        monkeypatch.delenv(f"RANKINGS_DB_{key}")
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "RANKINGS_DB_HOST=from-file\n"
+        "RANKINGS_DB_SCHEMA=rankings_v2\n"
+        "RANKINGS_DB_PORT='6543'\n"
+        'RANKINGS_DB_SSLMODE="require"\n',
+        encoding="utf-8",
+    )
+
+    polls.load_env_file(env_file)
+
+    assert os.environ["RANKINGS_DB_HOST"] == "from-env-host"
+    assert os.environ["RANKINGS_DB_SCHEMA"] == "rankings_v2"
+    assert os.environ["RANKINGS_DB_PORT"] == "6543"
+    assert os.environ["RANKINGS_DB_SSLMODE"] == "require"
+    assert polls.resolve_schema() == "rankings_v2"
+
+
+def test_missing_env_file_exits(tmp_path):
+    with pytest.raises(SystemExit):
+        polls.load_env_file(tmp_path / "missing.env")
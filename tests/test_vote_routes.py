@@ -0,0 +1,210 @@
+"""Route-level tests for vote submission, with the database and Redis faked."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from vote_api.connections import get_db_session
+from vote_api.routes import votes
+
+FINGERPRINT = "ab" * 32
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def first(self):
+        return self._value
+
+    def one(self):
+        return self._value
+
+    def scalar_one(self):
+        return self._value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+class _FakeSession:
+    """Answers each execute() with the next scripted result, in order."""
+
+    def __init__(self, results):
+        self._results = list(results)
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result(self._results.pop(0))
+
+    def add(self, _obj):
+        pass
+
+    async def commit(self):
+        self.committed = True
+
+
+class _NotSuspicious:
+    async def check_suspicious_patterns(self, ip_hash, fingerprint):
+        return (False, None)
+
+    async def record_vote_attempt(self, *args, **kwargs):
+        pass
+
+
+def category_row(comparison_mode: str, **settings):
+    return SimpleNamespace(
+        id=5, is_active=True, comparison_mode=comparison_mode, settings=settings
+    )
+
+
+@pytest.fixture
+def vote_api(monkeypatch):
+    monkeypatch.setenv("VOTE_IP_PEPPER", "test-pepper")
+    state = SimpleNamespace(session=None, tally=[], item_ids=frozenset(range(1, 20)))
+
+    class _CategoryCache:
+        def __init__(self, _redis):
+            pass
+
+        async def get_item_ids(self, _session, _category_id):
+            return state.item_ids
+
+    class _ResultsCache:
+        def __init__(self, _redis):
+            pass
+
+        async def bump(self, _category_id):
+            pass
+
+    class _Tally:
+        def __init__(self, _session):
+            pass
+
+        async def apply(self, category_id, choices, delta=1):
+            state.tally.append(("apply", category_id, list(choices)))
+
+        async def move(self, category_id, item_id, old_rank, new_rank):
+            state.tally.append(("move", category_id, item_id, old_rank, new_rank))
+
+    monkeypatch.setattr(votes, "CategoryCache", _CategoryCache)
+    monkeypatch.setattr(votes, "ResultsCache", _ResultsCache)
+    monkeypatch.setattr(votes, "TallyService", _Tally)
+
+    app = FastAPI()
+    app.include_router(votes.router)
+    app.dependency_overrides[get_db_session] = lambda: state.session
+    app.dependency_overrides[votes.get_anti_manipulation] = _NotSuspicious
+
+    state.client = TestClient(app)
+    return state
+
+
+def test_upsert_new_choice_applies_tally(vote_api):
+    # category lookup, vote upsert -> (id, inserted), choice upsert -> old rank
+    vote_api.session = _FakeSession(
+        [category_row("tournament_tiers"), (42, True), None]
+    )
+
+    response = vote_api.client.post(
+        "/api/v1/vote/upsert",
+        json={"category_id": 5, "fingerprint": FINGERPRINT, "choices": [10, 2]},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["vote_id"] == 42
+    assert vote_api.tally == [("apply", 5, [(10, 2)])]
+    assert vote_api.session.committed
+
+
+def test_upsert_existing_choice_moves_tally(vote_api):
+    vote_api.session = _FakeSession([category_row("tournament_tiers"), (42, False), 1])
+
+    response = vote_api.client.post(
+        "/api/v1/vote/upsert",
+        json={"category_id": 5, "fingerprint": FINGERPRINT, "choices": [10, 4]},
+    )
+
+    assert response.status_code == 200
+    assert vote_api.tally == [("move", 5, 10, 1, 4)]
+    assert vote_api.session.committed
+
+
+def test_upsert_rejects_non_tier_categories_without_tallying(vote_api):
+    vote_api.session = _FakeSession([category_row("single_choice")])
+
+    response = vote_api.client.post(
+        "/api/v1/vote/upsert",
+        json={"category_id": 5, "fingerprint": FINGERPRINT, "choices": [10, 2]},
+    )
+
+    assert response.status_code == 400
+    assert vote_api.tally == []
+    assert not vote_api.session.committed
+
+
+@pytest.mark.parametrize(
+    ("comparison_mode", "choices"),
+    [
+        pytest.param("ranked_list", [10, 11, 10], id="ranked_list"),
+        pytest.param("tournament_tiers", [10, 1, 11, 2, 10, 3], id="tournament_tiers"),
+        pytest.param("multi_select", [10, 10], id="multi_select"),
+    ],
+)
+def test_submit_rejects_repeated_items(vote_api, comparison_mode, choices):
+    vote_api.session = _FakeSession([category_row(comparison_mode)])
+
+    response = vote_api.client.post(
+        "/api/v1/vote",
+        json={"category_id": 5, "fingerprint": FINGERPRINT, "choices": choices},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Duplicate choices are not allowed"}
+    assert not vote_api.session.committed
+
+
+def test_submit_allows_repeated_tiers_for_distinct_items(vote_api):
+    # Only item ids are checked for repeats; tier indices may be shared
+    vote_api.session = _FakeSession([category_row("tournament_tiers"), 42])
+
+    response = vote_api.client.post(
+        "/api/v1/vote",
+        json={"category_id": 5, "fingerprint": FINGERPRINT, "choices": [10, 1, 11, 1]},
+    )
+
+    assert response.status_code == 200
+    assert vote_api.tally == [("apply", 5, [(10, 1), (11, 1)])]
+
+
+def test_submit_elo_same_item_reports_winner_loser_message(vote_api):
+    vote_api.session = _FakeSession([category_row("elo_tournament")])
+
+    response = vote_api.client.post(
+        "/api/v1/vote",
+        json={"category_id": 5, "fingerprint": FINGERPRINT, "choices": [10, 10]},
+    )
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Winner and loser must be different items"}
+
+
+def test_submit_names_the_unnest_columns(vote_api):
+    vote_api.session = _FakeSession([category_row("ranked_list"), 42])
+
+    response = vote_api.client.post(
+        "/api/v1/vote",
+        json={"category_id": 5, "fingerprint": FINGERPRINT, "choices": [10, 11]},
+    )
+
+    assert response.status_code == 200
+    sql = str(vote_api.session.statements[1].compile(dialect=postgresql.dialect()))
+    assert "AS anon_1(item_id, rank)" in sql
+    assert "anon_1.item_id" in sql and "anon_1.rank" in sql